@@ -14,16 +14,23 @@ MIN_CONTENT_LENGTH = 100
 
 # Model and token related constants
 DEFAULT_TEMPERATURE = 0.55
+DEFAULT_SMART_TOKEN_LIMIT = 16000
+DEFAULT_SUBTOPIC_CONTEXT_TOKENS = 6000
+TOKEN_LIMIT_COMPLETION_RESERVE = 1024
 
 # Search and retrieval related constants
 DEFAULT_MAX_SEARCH_RESULTS_PER_QUERY = 5
 DEFAULT_MAX_ITERATIONS = 5
 DEFAULT_MAX_SUBTOPICS = 5
 DEFAULT_SIMILARITY_THRESHOLD = 0.38
+DEFAULT_QUERY_CACHE_THRESHOLD = 0.92
+PCA_COMPONENTS = 128
+PCA_FIT_SAMPLE_SIZE = 256
 DEFAULT_TOTAL_WORDS = 800
 
 # Text processing constants
 MIN_QUERY_LENGTH = 3
+MAX_SCRAPE_BYTES = 2 * 1024 * 1024  # cap per page body before parsing
 
 # Report format constants
 DEFAULT_REPORT_FORMAT = "APA"
@@ -32,6 +39,13 @@ DEFAULT_REPORT_FORMAT = "APA"
 DEFAULT_RETRIEVER = "tavily"
 DEFAULT_SCRAPER = "bs"
 
+# Scrape cache related constants
+DEFAULT_SCRAPE_CACHE_TTL = 86400  # seconds; 0 disables the cache
+
+# Search cache related constants
+SEARCH_CACHE_TTL = 3600  # seconds
+SEARCH_CACHE_MAX_ENTRIES = 1024
+
 # Langfuse related constants
 DEFAULT_LANGFUSE_HOST = "https://cloud.langfuse.com"
 
@@ -1,21 +1,51 @@
 # backend/literesearch/embedding_service.py
 import os
+from typing import List, Optional
+
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
 from langchain_core.embeddings import Embeddings
 from utils.llm_tools import init_embeddings
 
+# Local embedding cache directory, alongside the LLM cache in data/
+EMBEDDING_CACHE_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "data", "embedding_cache"
+)
 
 class Memory:
     """Memory class for managing and retrieving embedding models"""
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        embedding_provider: str = "openai",
+        chunk_size: Optional[int] = None,
+        **kwargs,
+    ):
         """
         Initialize Memory class with OpenAI embeddings
-        
+
+        :param embedding_provider: Embedding provider name (only "openai"
+            style providers are supported)
+        :param chunk_size: Optional batch size override; defaults to the
+            EMBEDDING_MAX_BATCH_SIZE environment variable
         :param kwargs: Optional parameters (kept for compatibility)
         """
         # Configure official batch size via OpenAIEmbeddings chunk_size
-        chunk_size = int(os.environ.get("EMBEDDING_MAX_BATCH_SIZE", "64"))
-        self._embeddings = init_embeddings(chunk_size=chunk_size)
+        if chunk_size is None:
+            chunk_size = int(os.environ.get("EMBEDDING_MAX_BATCH_SIZE", "64"))
+        underlying_embeddings = init_embeddings(chunk_size=chunk_size)
+
+        # Wrap embeddings with a persistent file-backed cache so duplicate
+        # texts across iterations/sessions skip the remote API call.
+        # Namespace by model name to avoid cross-model collisions.
+        model_name = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+        store = LocalFileStore(EMBEDDING_CACHE_DIR)
+        self._embeddings = CacheBackedEmbeddings.from_bytes_store(
+            underlying_embeddings,
+            store,
+            namespace=model_name,
+            query_embedding_cache=True,
+        )
 
     def get_embeddings(self) -> Embeddings:
         """
@@ -24,3 +54,16 @@ class Memory:
         :return: Embedding model instance
         """
         return self._embeddings
+
+    def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a batch of texts in one call
+
+        Prefer this over looping embed_query per text: embed_documents sends
+        texts to the API in provider-sized batches (chunk_size, OpenAI allows
+        up to 2048 inputs of 8191 tokens each per request).
+
+        :param texts: List of texts to embed
+        :return: List of embedding vectors
+        """
+        return self._embeddings.embed_documents(texts)
@@ -2,9 +2,15 @@
 
 import json
 import asyncio
-from typing import List, Dict, Tuple, Any, Optional
+import logging
+import os
+
+import orjson
+import tiktoken
+
+from functools import lru_cache, partial, wraps
+from typing import AsyncIterator, List, Dict, Tuple, Any, Optional
 from pydantic import BaseModel, Field
-from tenacity import retry, stop_after_attempt, wait_fixed
 
 from langchain.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
@@ -25,10 +31,13 @@ from backend.literesearch.web_retriever import (
     ContextCompressor,
 )
 from backend.literesearch.research_enums import ReportType, ReportSource, Tone
+from backend.literesearch.constants import TOKEN_LIMIT_COMPLETION_RESERVE
 from backend.literesearch.embedding_service import Memory
 from utils.llm_tools import init_language_model
 from utils.langfuse_tools import get_langfuse_config
 
+logger = logging.getLogger(__name__)
+
 
 class AgentResponse(BaseModel):
     """AI agent response model"""
@@ -53,28 +62,7 @@ class Subtopics(BaseModel):
     subtopics: List[Subtopic] = []
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
-async def choose_agent(
-    query: str, cfg: Config, session_id: Optional[str] = None
-) -> Tuple[str, str]:
-    """
-    Choose appropriate AI agent for query
-
-    :param query: Query string
-    :param cfg: Configuration object
-    :param session_id: Optional session ID
-    :return: Server type and agent role prompt
-    """
-    try:
-        language_model = init_language_model(temperature=cfg.temperature)
-        chat = language_model
-
-        system_message = "{auto_agent_instructions}"
-        human_message = "task: {query}"
-
-        parser = JsonOutputParser(pydantic_object=AgentResponse)
-
-        format_instructions = """
+_FORMAT_INSTRUCTIONS = """
 Output your answer as a JSON object that conforms to the following schema:
 ```json
 {schema}
@@ -88,17 +76,135 @@ Important instructions:
 5. Do not include any explanations or comments within the JSON output.
         """
 
-        prompt_template = ChatPromptTemplate.from_messages(
-            [
-                ("system", system_message + format_instructions),
-                ("human", human_message),
-            ]
-        ).partial(
-            auto_agent_instructions=auto_agent_instructions(),
-            schema=AgentResponse.model_json_schema(),
-        )
+# Schemas and prompt templates are pure and identical across calls, so build
+# them once at import time instead of on every agent dispatch. Serializing
+# the schemas here also keeps pydantic reflection out of template formatting.
+_AGENT_SCHEMA = orjson.dumps(AgentResponse.model_json_schema()).decode()
+_SUBTOPICS_SCHEMA = orjson.dumps(Subtopics.model_json_schema()).decode()
+
+_AGENT_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        ("system", "{auto_agent_instructions}" + _FORMAT_INSTRUCTIONS),
+        ("human", "task: {query}"),
+    ]
+).partial(
+    auto_agent_instructions=auto_agent_instructions(),
+    schema=_AGENT_SCHEMA,
+)
+
+_SUBTOPICS_PROMPT_TEMPLATE = ChatPromptTemplate.from_template(
+    generate_subtopics_prompt() + _FORMAT_INSTRUCTIONS
+).partial(schema=_SUBTOPICS_SCHEMA)
+
+# Parsers are stateless; share one instance per response model instead of
+# constructing a pydantic-backed parser on every call
+_AGENT_PARSER = JsonOutputParser(pydantic_object=AgentResponse)
+_SUBTOPICS_PARSER = JsonOutputParser(pydantic_object=Subtopics)
+
+
+# Constant metadata skeleton copied per call so only dynamic fields are
+# assigned on the hot path
+_GENERATE_REPORT_METADATA = {
+    "query": None,
+    "report_type": None,
+    "tone": None,
+    "main_topic": None,
+    "context_length": 0,
+}
+
+
+def _async_retry(attempts: int = 3, wait: float = 2.0):
+    """
+    Lightweight retry decorator for async functions
+
+    Retries the wrapped coroutine up to `attempts` times with a fixed wait,
+    re-raising the last error. Replaces tenacity for these hot paths to
+    avoid its per-attempt wrapper overhead.
+
+    :param attempts: Maximum number of attempts
+    :param wait: Seconds to sleep between attempts
+    :return: Decorator
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(1, attempts + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception:
+                    if attempt == attempts:
+                        raise
+                    await asyncio.sleep(wait)
+
+        return wrapper
+
+    return decorator
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(model_name: str) -> tiktoken.Encoding:
+    """
+    Get a cached tiktoken encoder for the given model
+
+    :param model_name: Model name
+    :return: Token encoder, falling back to cl100k_base for unknown models
+    """
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _trim_to_token_limit(content: str, token_limit: int) -> str:
+    """
+    Trim prompt content to the configured token budget before dispatch
+
+    Counting locally avoids a wasted round trip when an oversize context
+    would be rejected or truncated provider-side.
+
+    :param content: Prompt content
+    :param token_limit: Model context limit in tokens
+    :return: Content trimmed to the budget, reserving completion headroom
+    """
+    encoding = _get_encoding(os.getenv("LLM_MODEL", "gpt-4"))
+    budget = token_limit - TOKEN_LIMIT_COMPLETION_RESERVE
+    tokens = encoding.encode(content)
+    if len(tokens) <= budget:
+        return content
+    return encoding.decode(tokens[:budget])
+
+
+@lru_cache(maxsize=8)
+def _get_llm(temperature: float) -> ChatOpenAI:
+    """
+    Get a shared language model client for the given temperature
+
+    Reusing one ChatOpenAI instance per temperature keeps its underlying
+    HTTP connection pool alive across calls instead of re-handshaking TLS.
+
+    :param temperature: Model output temperature
+    :return: Shared language model instance
+    """
+    return init_language_model(temperature=temperature)
 
-        chain = prompt_template | chat | parser
+
+@_async_retry(attempts=3, wait=2.0)
+async def choose_agent(
+    query: str, cfg: Config, session_id: Optional[str] = None
+) -> Tuple[str, str]:
+    """
+    Choose appropriate AI agent for query
+
+    :param query: Query string
+    :param cfg: Configuration object
+    :param session_id: Optional session ID
+    :return: Server type and agent role prompt
+    """
+    try:
+        chat = _get_llm(cfg.temperature)
+
+        chain = _AGENT_PROMPT_TEMPLATE | chat | _AGENT_PARSER
 
         # Get configuration using langfuse tools
         config = get_langfuse_config(
@@ -111,7 +217,7 @@ Important instructions:
 
         return agent_dict["server"], agent_dict["agent_role_prompt"]
     except json.JSONDecodeError:
-        print("Error parsing JSON. Using default agent.")
+        logger.warning("Error parsing JSON. Using default agent.")
         return "Default Agent", (
             "You are an AI critical thinking research assistant. Your sole purpose is to write well-structured, "
             "critical, and objective reports on given text."
@@ -137,8 +243,7 @@ async def get_sub_queries(
     :param session_id: Optional session ID
     :return: List of sub-queries
     """
-    language_model = init_language_model(temperature=cfg.temperature)
-    chat = language_model
+    chat = _get_llm(cfg.temperature)
 
     system_message = f"{agent_role_prompt}\n\n"
 
@@ -171,14 +276,14 @@ async def get_sub_queries(
     response = await chat.ainvoke(messages, config=config)
 
     try:
-        sub_queries = json.loads(response.content)
+        sub_queries = orjson.loads(response.content)
         return sub_queries
-    except json.JSONDecodeError:
-        print("Error parsing JSON. Returning original query.")
+    except (orjson.JSONDecodeError, json.JSONDecodeError):
+        logger.warning("Error parsing JSON. Returning original query.")
         return [query]
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
+@_async_retry(attempts=3, wait=2.0)
 async def construct_subtopics(
     task: str, data: str, config: Config, subtopics: List[Dict[str, str]] = [], session_id: Optional[str] = None
 ) -> List[Dict[str, str]]:
@@ -193,30 +298,9 @@ async def construct_subtopics(
     :return: Constructed subtopics list
     """
     try:
-        parser = JsonOutputParser(pydantic_object=Subtopics)
+        chat = _get_llm(config.temperature)
 
-        format_instructions = """
-Output your answer as a JSON object that conforms to the following schema:
-```json
-{schema}
-```
-
-Important instructions:
-1. Wrap your entire response between ```json and ``` tags.
-2. Ensure your JSON is valid and properly formatted.
-3. Do not include the schema definition in your answer.
-4. Only output the data instance that matches the schema.
-5. Do not include any explanations or comments within the JSON output.
-        """
-
-        prompt = ChatPromptTemplate.from_template(
-            generate_subtopics_prompt() + format_instructions
-        ).partial(schema=Subtopics.model_json_schema())
-
-        language_model = init_language_model(temperature=config.temperature)
-        chat = language_model
-
-        chain = prompt | chat | parser
+        chain = _SUBTOPICS_PROMPT_TEMPLATE | chat | _SUBTOPICS_PARSER
 
         # Get configuration using langfuse tools
         langfuse_config = get_langfuse_config(
@@ -242,11 +326,11 @@ Important instructions:
         return output["subtopics"]
 
     except Exception as e:
-        print("Exception occurred while parsing subtopics:", e)
+        logger.warning("Exception occurred while parsing subtopics: %s", e)
         return subtopics
 
 
-async def generate_report(
+async def stream_report(
     query: str,
     context: str,
     agent_role_prompt: str,
@@ -254,13 +338,16 @@ async def generate_report(
     tone: Tone,
     report_source: str,
     cfg: Config,
-    websocket: Any = None,
     main_topic: str = "",
     existing_headers: List[str] = [],
     session_id: Optional[str] = None,
-) -> str:
+) -> AsyncIterator[str]:
     """
-    Generate report
+    Stream report generation as an async iterator of text chunks
+
+    Callers can forward chunks as they arrive (websocket, UI) instead of
+    waiting for the full completion; accumulate with generate_report when
+    the joined string is needed.
 
     :param query: Query
     :param context: Context
@@ -269,13 +356,14 @@ async def generate_report(
     :param tone: Tone
     :param report_source: Report source
     :param cfg: Configuration object
-    :param websocket: WebSocket object (optional)
     :param main_topic: Main topic (optional)
     :param existing_headers: Existing headers list (optional)
     :param session_id: Optional session ID
-    :return: Generated report
+    :return: Async iterator of report text chunks
     """
     generate_prompt = get_report_by_type(report_type)
+    # Tone is a StrEnum, so the member itself is the prompt string
+    tone_value = str(tone) if tone else None
 
     if report_type == "subtopic_report":
         content = generate_prompt(
@@ -295,11 +383,12 @@ async def generate_report(
             total_words=cfg.total_words,
         )
 
-    if tone:
-        content += f", tone={tone.value}"
+    if tone_value:
+        content += f", tone={tone_value}"
 
-    language_model = init_language_model(temperature=cfg.temperature)
-    chat = language_model
+    content = _trim_to_token_limit(content, cfg.smart_token_limit)
+
+    chat = _get_llm(cfg.temperature)
 
     messages = [
         {"role": "system", "content": f"{agent_role_prompt}"},
@@ -307,44 +396,156 @@ async def generate_report(
     ]
 
     # Get configuration using langfuse tools
+    metadata = _GENERATE_REPORT_METADATA.copy()
+    metadata.update(
+        query=query,
+        report_type=report_type,
+        tone=tone_value,
+        main_topic=main_topic,
+        context_length=len(context),
+    )
     config = get_langfuse_config(
         trace_name="generate_report",
-        metadata={
-            "query": query,
-            "report_type": report_type,
-            "tone": tone.value if tone else None,
-            "main_topic": main_topic,
-            "context_length": len(context)
-        },
+        metadata=metadata,
         session_id=session_id
     )
 
-    response = await chat.ainvoke(messages, config=config)
+    async for chunk in chat.astream(messages, config=config):
+        if chunk.content:
+            yield chunk.content
 
-    return response.content
 
+async def generate_report(
+    query: str,
+    context: str,
+    agent_role_prompt: str,
+    report_type: str,
+    tone: Tone,
+    report_source: str,
+    cfg: Config,
+    websocket: Any = None,
+    main_topic: str = "",
+    existing_headers: List[str] = [],
+    session_id: Optional[str] = None,
+) -> str:
+    """
+    Generate report
 
-async def get_report_introduction(
+    Consumes stream_report, forwarding chunks to the websocket when one
+    is supplied, and returns the joined report.
+
+    :param query: Query
+    :param context: Context
+    :param agent_role_prompt: Agent role prompt
+    :param report_type: Report type
+    :param tone: Tone
+    :param report_source: Report source
+    :param cfg: Configuration object
+    :param websocket: WebSocket object (optional)
+    :param main_topic: Main topic (optional)
+    :param existing_headers: Existing headers list (optional)
+    :param session_id: Optional session ID
+    :return: Generated report
+    """
+    chunks: List[str] = []
+    async for chunk in stream_report(
+        query,
+        context,
+        agent_role_prompt,
+        report_type,
+        tone,
+        report_source,
+        cfg,
+        main_topic=main_topic,
+        existing_headers=existing_headers,
+        session_id=session_id,
+    ):
+        chunks.append(chunk)
+        if websocket:
+            await websocket.send_text(chunk)
+
+    return "".join(chunks)
+
+
+async def generate_all_subtopic_reports(
+    subtopics: List[Dict[str, str]],
+    context: str,
+    agent_role_prompt: str,
+    tone: Tone,
+    report_source: str,
+    cfg: Config,
+    main_topic: str = "",
+    contexts: Optional[List[str]] = None,
+    session_id: Optional[str] = None,
+) -> List[str]:
+    """
+    Generate all subtopic reports concurrently
+
+    Fans out one generate_report call per subtopic, bounded by the
+    configured concurrency limit, so total wall time approaches the
+    slowest single subtopic instead of the sum of all of them.
+
+    :param subtopics: List of subtopics
+    :param context: Context
+    :param agent_role_prompt: Agent role prompt
+    :param tone: Tone
+    :param report_source: Report source
+    :param cfg: Configuration object
+    :param main_topic: Main topic (optional)
+    :param contexts: Optional per-subtopic contexts, aligned with subtopics;
+        falls back to the shared context when not provided
+    :param session_id: Optional session ID
+    :return: List of subtopic reports, in subtopic order
+    """
+    semaphore = asyncio.Semaphore(cfg.DEFAULT_CONCURRENCY_LIMIT)
+    existing_headers = [subtopic["task"] for subtopic in subtopics]
+
+    # Freeze the per-run arguments once; each subtopic call then supplies
+    # only its own query and context
+    subtopic_report = partial(
+        generate_report,
+        agent_role_prompt=agent_role_prompt,
+        report_type="subtopic_report",
+        tone=tone,
+        report_source=report_source,
+        cfg=cfg,
+        main_topic=main_topic,
+        existing_headers=existing_headers,
+        session_id=session_id,
+    )
+
+    async def bounded_generate(subtopic: Dict[str, str], subtopic_context: str) -> str:
+        async with semaphore:
+            return await subtopic_report(subtopic["task"], subtopic_context)
+
+    return await asyncio.gather(
+        *[
+            bounded_generate(
+                subtopic, contexts[i] if contexts else context
+            )
+            for i, subtopic in enumerate(subtopics)
+        ]
+    )
+
+
+async def stream_report_introduction(
     query: str,
     context: str,
     role: str,
     config: Config,
-    websocket: Any = None,
     session_id: Optional[str] = None,
-) -> str:
+) -> AsyncIterator[str]:
     """
-    Get report introduction
+    Stream report introduction generation as an async iterator of chunks
 
     :param query: Query
     :param context: Context
     :param role: Role
     :param config: Configuration object
-    :param websocket: WebSocket object (optional)
     :param session_id: Optional session ID
-    :return: Generated report introduction
+    :return: Async iterator of introduction text chunks
     """
-    language_model = init_language_model(temperature=config.temperature)
-    chat = language_model
+    chat = _get_llm(config.temperature)
 
     prompt = generate_report_introduction_prompt(query, context)
 
@@ -364,9 +565,42 @@ async def get_report_introduction(
         session_id=session_id
     )
 
-    response = await chat.ainvoke(messages, config=langfuse_config)
+    async for chunk in chat.astream(messages, config=langfuse_config):
+        if chunk.content:
+            yield chunk.content
+
+
+async def get_report_introduction(
+    query: str,
+    context: str,
+    role: str,
+    config: Config,
+    websocket: Any = None,
+    session_id: Optional[str] = None,
+) -> str:
+    """
+    Get report introduction
+
+    Consumes stream_report_introduction, forwarding chunks to the
+    websocket when one is supplied, and returns the joined introduction.
 
-    return response.content
+    :param query: Query
+    :param context: Context
+    :param role: Role
+    :param config: Configuration object
+    :param websocket: WebSocket object (optional)
+    :param session_id: Optional session ID
+    :return: Generated report introduction
+    """
+    chunks: List[str] = []
+    async for chunk in stream_report_introduction(
+        query, context, role, config, session_id=session_id
+    ):
+        chunks.append(chunk)
+        if websocket:
+            await websocket.send_text(chunk)
+
+    return "".join(chunks)
 
 
 # Test functions have been moved to separate test files
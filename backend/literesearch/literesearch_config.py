@@ -1,12 +1,14 @@
 # literesearch_config.py
 
+import logging
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 # Initialize Langfuse (v3)
 from langfuse import Langfuse, get_client
 
-# Import constants
 from backend.literesearch.constants import (
     DEFAULT_SIMILARITY_THRESHOLD,
     DEFAULT_TEMPERATURE,
@@ -23,8 +25,74 @@ from backend.literesearch.constants import (
     MIN_CONTENT_LENGTH,
     DEFAULT_TIMEOUT,
     DEFAULT_MAX_WORKERS,
+    DEFAULT_SMART_TOKEN_LIMIT,
+    DEFAULT_QUERY_CACHE_THRESHOLD,
+    DEFAULT_SCRAPE_CACHE_TTL,
 )
 
+logger = logging.getLogger(__name__)
+
+
+# Langfuse only needs to be configured once per process; Config objects can
+# be created per research session, so track initialization at module scope.
+_LANGFUSE_INITIALIZED = False
+
+
+@dataclass(frozen=True, slots=True)
+class _EnvSettings:
+    """Immutable snapshot of environment-driven configuration values"""
+
+    retriever: str
+    similarity_threshold: float
+    temperature: float
+    user_agent: str
+    max_search_results_per_query: int
+    total_words: int
+    report_format: str
+    max_iterations: int
+    scraper: str
+    max_subtopics: int
+    smart_token_limit: int
+    query_cache_threshold: float
+    scrape_cache_ttl: int
+
+
+@lru_cache(maxsize=1)
+def _load_env_settings() -> _EnvSettings:
+    """
+    Read and convert environment configuration once per process
+
+    :return: Frozen settings snapshot shared by all Config instances
+    """
+    return _EnvSettings(
+        retriever=os.getenv("RETRIEVER", DEFAULT_RETRIEVER),
+        similarity_threshold=float(
+            os.getenv("SIMILARITY_THRESHOLD", str(DEFAULT_SIMILARITY_THRESHOLD))
+        ),
+        temperature=float(os.getenv("TEMPERATURE", str(DEFAULT_TEMPERATURE))),
+        user_agent=os.getenv("USER_AGENT", DEFAULT_USER_AGENT),
+        max_search_results_per_query=int(
+            os.getenv(
+                "MAX_SEARCH_RESULTS_PER_QUERY",
+                str(DEFAULT_MAX_SEARCH_RESULTS_PER_QUERY),
+            )
+        ),
+        total_words=int(os.getenv("TOTAL_WORDS", str(DEFAULT_TOTAL_WORDS))),
+        report_format=os.getenv("REPORT_FORMAT", DEFAULT_REPORT_FORMAT),
+        max_iterations=int(os.getenv("MAX_ITERATIONS", str(DEFAULT_MAX_ITERATIONS))),
+        scraper=os.getenv("SCRAPER", DEFAULT_SCRAPER),
+        max_subtopics=int(os.getenv("MAX_SUBTOPICS", str(DEFAULT_MAX_SUBTOPICS))),
+        smart_token_limit=int(
+            os.getenv("SMART_TOKEN_LIMIT", str(DEFAULT_SMART_TOKEN_LIMIT))
+        ),
+        query_cache_threshold=float(
+            os.getenv("QUERY_CACHE_THRESHOLD", str(DEFAULT_QUERY_CACHE_THRESHOLD))
+        ),
+        scrape_cache_ttl=int(
+            os.getenv("SCRAPE_CACHE_TTL", str(DEFAULT_SCRAPE_CACHE_TTL))
+        ),
+    )
+
 
 class Config:
     """Lite Research configuration class"""
@@ -37,18 +105,22 @@ class Config:
         :raises EnvironmentError: If required environment variables are not set
         """
 
-        self.retriever = os.getenv("RETRIEVER", DEFAULT_RETRIEVER)
-        self.similarity_threshold = float(os.getenv("SIMILARITY_THRESHOLD", str(DEFAULT_SIMILARITY_THRESHOLD)))
-        self.temperature = float(os.getenv("TEMPERATURE", str(DEFAULT_TEMPERATURE)))
-        self.user_agent = os.getenv("USER_AGENT", DEFAULT_USER_AGENT)
-        self.max_search_results_per_query = int(
-            os.getenv("MAX_SEARCH_RESULTS_PER_QUERY", str(DEFAULT_MAX_SEARCH_RESULTS_PER_QUERY))
-        )
-        self.total_words = int(os.getenv("TOTAL_WORDS", str(DEFAULT_TOTAL_WORDS)))
-        self.report_format = os.getenv("REPORT_FORMAT", DEFAULT_REPORT_FORMAT)
-        self.max_iterations = int(os.getenv("MAX_ITERATIONS", str(DEFAULT_MAX_ITERATIONS)))
-        self.scraper = os.getenv("SCRAPER", DEFAULT_SCRAPER)
-        self.max_subtopics = int(os.getenv("MAX_SUBTOPICS", str(DEFAULT_MAX_SUBTOPICS)))
+        # Copy from the cached env snapshot; instances stay mutable so
+        # callers can still override per-session limits
+        settings = _load_env_settings()
+        self.retriever = settings.retriever
+        self.similarity_threshold = settings.similarity_threshold
+        self.temperature = settings.temperature
+        self.user_agent = settings.user_agent
+        self.max_search_results_per_query = settings.max_search_results_per_query
+        self.total_words = settings.total_words
+        self.report_format = settings.report_format
+        self.max_iterations = settings.max_iterations
+        self.scraper = settings.scraper
+        self.max_subtopics = settings.max_subtopics
+        self.smart_token_limit = settings.smart_token_limit
+        self.query_cache_threshold = settings.query_cache_threshold
+        self.scrape_cache_ttl = settings.scrape_cache_ttl
         self.llm_kwargs = {}
 
         # Constants definition
@@ -64,8 +136,13 @@ class Config:
 
     def _init_langfuse(self):
         """
-        Initialize Langfuse configuration
+        Initialize Langfuse configuration (once per process)
         """
+        global _LANGFUSE_INITIALIZED
+        if _LANGFUSE_INITIALIZED:
+            return
+        _LANGFUSE_INITIALIZED = True
+
         try:
             langfuse_secret_key = os.getenv("LANGFUSE_SECRET_KEY")
             langfuse_public_key = os.getenv("LANGFUSE_PUBLIC_KEY")
@@ -80,8 +157,8 @@ class Config:
                 )
                 # Touch the client to ensure it is created
                 _ = get_client()
-                print(f"✅ Langfuse initialized successfully with host: {langfuse_host}")
+                logger.info("✅ Langfuse initialized successfully with host: %s", langfuse_host)
             else:
-                print("⚠️  Langfuse keys not found in environment variables. Monitoring will be disabled.")
+                logger.warning("⚠️  Langfuse keys not found in environment variables. Monitoring will be disabled.")
         except Exception as e:
-            print(f"❌ Failed to initialize Langfuse: {e}")
+            logger.warning("❌ Failed to initialize Langfuse: %s", e)
@@ -1,22 +1,29 @@
 # backend/literesearch/literesearcher.py
 
 import asyncio
+import io
 from typing import List, Dict, Any, Optional, Callable
 
+import numpy as np
+import tiktoken
+
+from backend.literesearch.constants import DEFAULT_SUBTOPIC_CONTEXT_TOKENS
 from backend.literesearch.literesearch_config import Config
 from backend.literesearch.research_enums import ReportType, ReportSource, Tone
 from backend.literesearch.web_retriever import (
     get_retriever,
     get_default_retriever,
-    scrape_urls,
+    async_scrape_urls,
     ContextCompressor,
 )
 from backend.literesearch.embedding_service import Memory
+from backend.literesearch.research_cache import report_cache
 from backend.literesearch.literesearch_agent import (
     choose_agent,
     get_sub_queries,
     construct_subtopics,
     generate_report,
+    generate_all_subtopic_reports,
     get_report_introduction,
 )
 from utils.langfuse_tools import generate_session_id
@@ -74,6 +81,12 @@ class LiteResearcher:
         self.verbose_callback = verbose_callback
         self.context: List[str] = []
         self.memory = Memory()
+
+        # Resolve the retriever class once; it depends only on configuration
+        # and would otherwise be re-resolved for every sub-query
+        self._retriever_class = (
+            get_retriever(self.cfg.retriever) or get_default_retriever()
+        )
         
         # Generate unique session ID for organizing the entire research workflow
         self.session_id = generate_session_id()
@@ -86,85 +99,212 @@ class LiteResearcher:
         if max_search_results_per_query is not None:
             self.cfg.max_search_results_per_query = max_search_results_per_query
 
-    def log(self, message: str) -> None:
+    def log(self, message: str, *args: Any) -> None:
         """
         Log information
 
-        :param message: Message to log
-        """
-        if self.verbose:
-            print(message)
-            if self.verbose_callback:
-                self.verbose_callback(message)
+        Formatting is deferred with %-style args so silenced runs
+        (verbose=False) pay nothing for message construction.
 
-    async def process_sub_query(self, sub_query: str, index: int, total: int) -> str:
+        :param message: Message to log (%-style format string)
+        :param args: Values interpolated into the message when verbose
+        """
+        if not self.verbose:
+            return
+        if args:
+            message = message % args
+        print(message)
+        if self.verbose_callback:
+            self.verbose_callback(message)
+
+    def retrieve_sub_query_urls(self, sub_query: str, index: int, total: int) -> List[str]:
         """
-        Process sub-query
+        Retrieve search result URLs for a sub-query
 
         :param sub_query: Sub-query
         :param index: Current sub-query index
         :param total: Total number of sub-queries
-        :return: Compressed context
+        :return: List of result URLs
         """
-        self.log(f"Processing sub-query {index}/{total}: {sub_query}")
+        self.log("Searching for sub-query %d/%d: %s", index, total, sub_query)
 
-        retriever_class = get_retriever(self.cfg.retriever) or get_default_retriever()
-        retriever = retriever_class(sub_query)
-        self.log(f"Using retriever: {retriever.__class__.__name__}")
+        retriever = self._retriever_class(sub_query)
+        self.log("Using retriever: %s", retriever.__class__.__name__)
 
         search_results = retriever.search(
             max_results=self.cfg.max_search_results_per_query
         )
 
-        urls = [result["href"] for result in search_results]
-        self.log(f"Scraping {len(urls)} URLs for sub-query...")
+        return [result["href"] for result in search_results]
 
-        scraped_content = scrape_urls(urls, self.cfg)
+    async def compress_sub_query_context(
+        self,
+        sub_query: str,
+        documents: List[Dict[str, Any]],
+        index: int,
+        total: int,
+    ) -> str:
+        """
+        Compress pre-scraped documents into context for a sub-query
 
+        :param sub_query: Sub-query
+        :param documents: Scraped documents for this sub-query's URLs
+        :param index: Current sub-query index
+        :param total: Total number of sub-queries
+        :return: Compressed context
+        """
         context_compressor = ContextCompressor(
-            scraped_content, self.memory.get_embeddings()
+            documents, self.memory.get_embeddings()
         )
-        self.log(f"Compressing context for sub-query...")
+        self.log("Compressing context for sub-query %d/%d...", index, total)
 
         compressed_context = await context_compressor.get_context(sub_query)
-        self.log(f"Context compression completed for sub-query {index}/{total}.")
+        self.log("Context compression completed for sub-query %d/%d.", index, total)
 
         return compressed_context
 
+    async def _select_subtopic_contexts(
+        self, subtopics: List[Dict[str, str]]
+    ) -> Optional[List[str]]:
+        """
+        Rank research contexts per subtopic under a token budget
+
+        Each subtopic only needs the slice of the research context relevant
+        to it; sending the full merged context to every subtopic report
+        multiplies prompt tokens and forces LLM-side truncation. Contexts
+        are ranked by cosine similarity against each subtopic title and
+        accumulated until the token budget is reached.
+
+        :param subtopics: Subtopic list from construct_subtopics
+        :return: Per-subtopic context strings aligned with subtopics, or
+            None when ranking is not possible
+        """
+        if not self.context or not subtopics:
+            return None
+
+        try:
+            embeddings = self.memory.get_embeddings()
+            context_vectors, topic_vectors = await asyncio.gather(
+                embeddings.aembed_documents(list(self.context)),
+                embeddings.aembed_documents([s["task"] for s in subtopics]),
+            )
+        except Exception as e:
+            # Ranking is an optimization; fall back to the shared context
+            self.log("Subtopic context ranking skipped: %s", e)
+            return None
+
+        context_matrix = np.asarray(context_vectors, dtype=np.float64)
+        norms = np.linalg.norm(context_matrix, axis=1)
+        norms[norms == 0] = 1.0
+        context_matrix /= norms[:, None]
+
+        encoding = tiktoken.get_encoding("cl100k_base")
+        token_counts = [len(encoding.encode(c)) for c in self.context]
+
+        selected_contexts = []
+        for topic_vector in topic_vectors:
+            vector = np.asarray(topic_vector, dtype=np.float64)
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector /= norm
+            scores = context_matrix @ vector
+
+            chosen: List[int] = []
+            used_tokens = 0
+            for index in np.argsort(-scores):
+                index = int(index)
+                if chosen and used_tokens + token_counts[index] > DEFAULT_SUBTOPIC_CONTEXT_TOKENS:
+                    break
+                chosen.append(index)
+                used_tokens += token_counts[index]
+
+            # Preserve the original context order within the selection
+            chosen.sort()
+            selected_contexts.append(
+                "\n".join(self.context[index] for index in chosen)
+            )
+
+        return selected_contexts
+
     async def conduct_research(self) -> List[str]:
         """
         Conduct research task
 
         :return: List of research contexts
         """
-        self.log(f"🔎 Starting research task for '{self.query}'...")
-        self.log(f"🎯 Research session ID: {self.session_id}")
+        self.log("🔎 Starting research task for '%s'...", self.query)
+        self.log("🎯 Research session ID: %s", self.session_id)
 
         if not (self.agent and self.role):
             self.agent, self.role = await choose_agent(self.query, self.cfg, session_id=self.session_id)
-        self.log(f"Selected agent: {self.agent}")
+        self.log("Selected agent: %s", self.agent)
 
         sub_queries = await get_sub_queries(
             self.query, self.role, self.cfg, None, self.report_type, session_id=self.session_id
         )
-        self.log(f"Generated sub-queries: {sub_queries}")
-
-        self.log(f"Starting search and scraping for {len(sub_queries)} sub-queries...")
-
-        # Use concurrency limit constant from configuration
-        semaphore = asyncio.Semaphore(self.cfg.DEFAULT_CONCURRENCY_LIMIT)
+        self.log("Generated sub-queries: %s", sub_queries)
+
+        self.log("Starting search and scraping for %d sub-queries...", len(sub_queries))
+
+        # Collect URLs for all sub-queries first, deduplicating across them:
+        # paraphrased sub-queries often surface the same pages, which would
+        # otherwise be fetched and embedded once per sub-query
+        # The search API calls are I/O-bound, so run them in parallel in
+        # worker threads instead of one sequential round-trip per sub-query
+        url_lists = await asyncio.gather(
+            *[
+                asyncio.to_thread(
+                    self.retrieve_sub_query_urls, sub_query, i + 1, len(sub_queries)
+                )
+                for i, sub_query in enumerate(sub_queries)
+            ]
+        )
 
-        async def limited_process_sub_query(*args):
-            async with semaphore:
-                return await self.process_sub_query(*args)
+        sub_query_urls: Dict[str, List[str]] = {}
+        unique_urls: List[str] = []
+        seen_urls = set()
+        for sub_query, urls in zip(sub_queries, url_lists):
+            sub_query_urls[sub_query] = urls
+            for url in urls:
+                if url not in seen_urls:
+                    seen_urls.add(url)
+                    unique_urls.append(url)
+
+        self.log("Scraping %d unique URLs across all sub-queries...", len(unique_urls))
+        scraped_content = await async_scrape_urls(unique_urls, self.cfg)
+        scraped_by_url = {page["url"]: page for page in scraped_content}
+
+        # Drain the sub-queries through a small worker pool instead of
+        # materializing one task per sub-query upfront: concurrency is
+        # bounded by the number of workers rather than a semaphore. Each
+        # result is written to its sub-query's slot so the final context
+        # keeps sub-query order regardless of completion order
+        pending: asyncio.Queue = asyncio.Queue()
+        for i, sub_query in enumerate(sub_queries):
+            pending.put_nowait((i, sub_query))
+
+        contexts: List[Optional[str]] = [None] * len(sub_queries)
+
+        async def compression_worker() -> None:
+            while True:
+                try:
+                    index, sub_query = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                documents = [
+                    scraped_by_url[url]
+                    for url in sub_query_urls[sub_query]
+                    if url in scraped_by_url
+                ]
+                contexts[index] = await self.compress_sub_query_context(
+                    sub_query, documents, index + 1, len(sub_queries)
+                )
 
-        tasks = [
-            limited_process_sub_query(sub_query, i + 1, len(sub_queries))
-            for i, sub_query in enumerate(sub_queries)
-        ]
-        self.context = await asyncio.gather(*tasks)
+        worker_count = min(self.cfg.DEFAULT_CONCURRENCY_LIMIT, len(sub_queries))
+        await asyncio.gather(*[compression_worker() for _ in range(worker_count)])
+        self.context = [context for context in contexts if context is not None]
 
-        self.log(f"Research phase completed. Total contexts collected: {len(self.context)}")
+        self.log("Research phase completed. Total contexts collected: %d", len(self.context))
 
         return self.context
 
@@ -177,45 +317,59 @@ class LiteResearcher:
         self.log("Starting report generation...")
 
         full_context = "\n".join(self.context)
-        self.log(f"Merged context length: {len(full_context)} characters")
+        self.log("Merged context length: %d characters", len(full_context))
 
         if self.report_type == ReportType.DetailedReport.value:
             self.log("Generating detailed report...")
 
             self.log("Building subtopics...")
             subtopics = await construct_subtopics(self.query, full_context, self.cfg, session_id=self.session_id)
-            self.log(f"Generated {len(subtopics)} subtopics")
+            self.log("Generated %d subtopics", len(subtopics))
 
-            self.log("Generating report introduction...")
-            introduction = await get_report_introduction(
-                self.query, full_context, self.role, self.cfg, session_id=self.session_id
-            )
-            self.log("Introduction generated successfully")
+            # Budget each subtopic's context by relevance instead of sending
+            # the full merged context to every subtopic report
+            subtopic_contexts = await self._select_subtopic_contexts(subtopics)
 
-            subtopic_reports = []
-            for i, subtopic in enumerate(subtopics, 1):
-                self.log(
-                    f"Generating report for subtopic {i}/{len(subtopics)}: '{subtopic['task']}'"
-                )
-                subtopic_report = await generate_report(
-                    subtopic["task"],
+            # Introduction and subtopic reports share no data dependency,
+            # so run them concurrently to overlap their LLM round trips
+            self.log(
+                "Generating introduction and reports for %d subtopics in parallel...",
+                len(subtopics),
+            )
+            introduction, subtopic_reports = await asyncio.gather(
+                get_report_introduction(
+                    self.query,
+                    full_context,
+                    self.role,
+                    self.cfg,
+                    websocket=self.websocket,
+                    session_id=self.session_id,
+                ),
+                generate_all_subtopic_reports(
+                    subtopics,
                     full_context,
                     self.role,
-                    "subtopic_report",
                     self.tone,
                     self.report_source,
                     self.cfg,
                     main_topic=self.query,
-                    existing_headers=[s["task"] for s in subtopics],
+                    contexts=subtopic_contexts,
                     session_id=self.session_id,
-                )
-                subtopic_reports.append(subtopic_report)
-                self.log(f"Report for subtopic {i} generated successfully")
-
-            full_report = f"{introduction}\n\n" + "\n\n".join(subtopic_reports)
+                ),
+            )
+            self.log("Introduction and all subtopic reports generated successfully")
+
+            # Assemble through one buffer instead of building intermediate
+            # concatenation copies of a multi-thousand-word report
+            buffer = io.StringIO()
+            buffer.write(introduction)
+            for subtopic_report in subtopic_reports:
+                buffer.write("\n\n")
+                buffer.write(subtopic_report)
+            full_report = buffer.getvalue()
             self.log("Detailed report compilation completed")
         else:
-            self.log(f"Generating {self.report_type} report...")
+            self.log("Generating %s report...", self.report_type)
             full_report = await generate_report(
                 self.query,
                 full_context,
@@ -224,11 +378,12 @@ class LiteResearcher:
                 self.tone,
                 self.report_source,
                 self.cfg,
+                websocket=self.websocket,
                 session_id=self.session_id,
             )
             self.log("Report generation completed")
 
-        self.log(f"Final report length: {len(full_report)} characters")
+        self.log("Final report length: %d characters", len(full_report))
         return full_report
 
     async def run(self) -> str:
@@ -237,6 +392,32 @@ class LiteResearcher:
 
         :return: Generated research report
         """
+        query_embedding = await self.memory.get_embeddings().aembed_query(self.query)
+
+        # A similar query run with a different report type, tone, source or
+        # depth settings produces a different report, so cache entries are
+        # only shared between runs with identical report-shaping parameters
+        cache_params = (
+            self.report_type,
+            self.tone.value if isinstance(self.tone, Tone) else str(self.tone),
+            self.report_source,
+            self.cfg.max_iterations,
+            self.cfg.max_subtopics,
+            self.cfg.max_search_results_per_query,
+        )
+
+        cached = report_cache.lookup(
+            query_embedding,
+            cache_params,
+            similarity_threshold=self.cfg.query_cache_threshold,
+        )
+        if cached is not None:
+            self.context, report = cached
+            self.log("Serving report from semantic query cache")
+            return report
+
         await self.conduct_research()
         report = await self.generate_report()
+
+        report_cache.store(query_embedding, cache_params, self.context, report)
         return report
@@ -0,0 +1,233 @@
+# backend/literesearch/research_cache.py
+
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from backend.literesearch.constants import (
+    DEFAULT_QUERY_CACHE_THRESHOLD,
+    PCA_COMPONENTS,
+    PCA_FIT_SAMPLE_SIZE,
+)
+
+
+class PCAEmbeddingReducer:
+    """PCA projection for cached query embeddings
+
+    Raw embeddings are 768-1536 dims; storing and comparing them at full
+    width inflates memory and every dot product. Once enough sample vectors
+    accumulate, fit a PCA basis (numpy SVD) and project subsequent vectors
+    down to a compact subspace with negligible recall loss.
+    """
+
+    def __init__(
+        self,
+        n_components: int = PCA_COMPONENTS,
+        fit_sample_size: int = PCA_FIT_SAMPLE_SIZE,
+    ):
+        """
+        Initialize PCA reducer
+
+        :param n_components: Target dimensionality
+        :param fit_sample_size: Number of samples to collect before fitting
+        """
+        self.n_components = n_components
+        self.fit_sample_size = fit_sample_size
+        self._samples: List[np.ndarray] = []
+        self._mean: Optional[np.ndarray] = None
+        self._components: Optional[np.ndarray] = None
+
+    @property
+    def fitted(self) -> bool:
+        """Whether the PCA basis has been fitted"""
+        return self._components is not None
+
+    def add_sample(self, vector: np.ndarray) -> bool:
+        """
+        Collect a fit sample, fitting the basis once enough have accumulated
+
+        :param vector: Full-dimensional embedding vector
+        :return: True if this call triggered the fit
+        """
+        if self.fitted:
+            return False
+        self._samples.append(vector)
+        if len(self._samples) >= self.fit_sample_size:
+            self._fit()
+            return True
+        return False
+
+    def _fit(self) -> None:
+        """Fit the PCA basis over the collected samples"""
+        matrix = np.vstack(self._samples)
+        self._mean = matrix.mean(axis=0)
+        _, _, vt = np.linalg.svd(matrix - self._mean, full_matrices=False)
+        self._components = vt[: self.n_components]
+        self._samples = []
+
+    def transform(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Project a vector onto the fitted basis
+
+        :param vector: Full-dimensional embedding vector
+        :return: Reduced vector
+        """
+        return (vector - self._mean) @ self._components.T
+
+
+class SemanticReportCache:
+    """Semantic cache of completed research results
+
+    Research queries are often near-duplicates of earlier ones. Keyed by the
+    query embedding, this cache short-circuits the whole
+    retrieve -> scrape -> compress -> LLM pipeline when a new query is close
+    enough (cosine similarity) to one already answered in this process.
+
+    Each entry also records the report-shaping parameters (report type,
+    tone, source, iteration limits) it was produced under; a similarity hit
+    is only served when those parameters match, so rerunning a query with a
+    different report type or tone never returns the wrong cached report.
+    """
+
+    def __init__(self, similarity_threshold: float = DEFAULT_QUERY_CACHE_THRESHOLD):
+        """
+        Initialize semantic report cache
+
+        :param similarity_threshold: Cosine similarity above which a cached
+            result is served
+        """
+        self.similarity_threshold = similarity_threshold
+        # Full-dimensional normalized vectors, kept so entries stored before
+        # the PCA fit can be re-projected afterwards
+        self._full_vectors: List[np.ndarray] = []
+        # Search-space vectors (PCA-reduced once the basis is fitted)
+        self._vectors: List[np.ndarray] = []
+        self._results: List[Tuple[List[str], str]] = []
+        # Report-shaping parameters per entry; lookups require equality
+        self._params: List[Tuple[Any, ...]] = []
+        self._reducer = PCAEmbeddingReducer()
+        # Stacked copy of _vectors, rebuilt lazily after inserts, so lookups
+        # run as a single matrix-vector product instead of a Python loop
+        self._matrix: Optional[np.ndarray] = None
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+        """
+        L2-normalize an embedding vector
+
+        :param embedding: Embedding vector
+        :return: Normalized vector, or None for a zero vector
+        """
+        vector = np.asarray(embedding, dtype=np.float64)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+
+    def _project(self, normalized: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Map a normalized vector into the search space
+
+        :param normalized: Normalized full-dimensional vector
+        :return: Renormalized reduced vector, or None if it collapses
+        """
+        if not self._reducer.fitted:
+            return normalized
+        reduced = self._reducer.transform(normalized)
+        norm = np.linalg.norm(reduced)
+        if norm == 0:
+            return None
+        return reduced / norm
+
+    def lookup(
+        self,
+        embedding: List[float],
+        params: Tuple[Any, ...],
+        similarity_threshold: Optional[float] = None,
+    ) -> Optional[Tuple[List[str], str]]:
+        """
+        Look up a cached (context, report) result for a query embedding
+
+        :param embedding: Query embedding
+        :param params: Report-shaping parameters the result must match
+        :param similarity_threshold: Optional per-call threshold override
+        :return: Cached (context, report) tuple, or None on miss
+        """
+        normalized = self._normalize(embedding)
+        if normalized is None:
+            return None
+        normalized = self._project(normalized)
+        if normalized is None:
+            return None
+
+        threshold = (
+            similarity_threshold
+            if similarity_threshold is not None
+            else self.similarity_threshold
+        )
+        if not self._vectors:
+            return None
+
+        if self._matrix is None:
+            self._matrix = np.vstack(self._vectors)
+
+        # Only entries produced under the same report-shaping parameters are
+        # candidates; mask the rest out of the similarity scores
+        matches = np.fromiter(
+            (stored == params for stored in self._params),
+            dtype=bool,
+            count=len(self._params),
+        )
+        if not matches.any():
+            return None
+
+        scores = np.where(matches, self._matrix @ normalized, -1.0)
+        best = int(np.argmax(scores))
+        if float(scores[best]) >= threshold:
+            return self._results[best]
+        return None
+
+    def store(
+        self,
+        embedding: List[float],
+        params: Tuple[Any, ...],
+        context: List[str],
+        report: str,
+    ) -> None:
+        """
+        Store a completed research result under its query embedding
+
+        :param embedding: Query embedding
+        :param params: Report-shaping parameters the result was produced under
+        :param context: Collected research contexts
+        :param report: Generated report
+        """
+        normalized = self._normalize(embedding)
+        if normalized is None:
+            return
+        projected = self._project(normalized)
+        if projected is None:
+            return
+
+        self._full_vectors.append(normalized)
+        self._vectors.append(projected)
+        self._results.append((context, report))
+        self._params.append(params)
+        self._matrix = None
+
+        # Once enough samples accumulate to fit the PCA basis, re-project
+        # every stored vector into the reduced search space
+        if self._reducer.add_sample(normalized):
+            reprojected = []
+            for vector in self._full_vectors:
+                reduced = self._project(vector)
+                if reduced is None:
+                    # Degenerate projection; keep a zero vector so the entry
+                    # stays index-aligned but can never match
+                    reduced = np.zeros(self._reducer.n_components)
+                reprojected.append(reduced)
+            self._vectors = reprojected
+
+
+# Process-wide cache shared by all LiteResearcher instances
+report_cache = SemanticReportCache()
@@ -1,10 +1,10 @@
 # backend/literesearch/research_enums.py
 
-from enum import Enum
+from enum import StrEnum
 
 
-class ReportType(Enum):
-    """Report type enumeration"""
+class ReportType(StrEnum):
+    """Report type enumeration (members are their string values)"""
 
     ResearchReport = "research_report"
     ResourceReport = "resource_report"
@@ -14,7 +14,7 @@ class ReportType(Enum):
     SubtopicReport = "subtopic_report"
 
 
-class ReportSource(Enum):
+class ReportSource(StrEnum):
     """Report source enumeration"""
 
     Web = "web"
@@ -22,7 +22,7 @@ class ReportSource(Enum):
     LangChainDocuments = "langchain_documents"
 
 
-class Tone(Enum):
+class Tone(StrEnum):
     """Report tone enumeration"""
 
     Objective = "Objective (Present facts and findings fairly and without bias)"
@@ -1,9 +1,35 @@
 # backend/literesearch/research_prompts.py
 
+import time
 from datetime import date, datetime, timezone
+from functools import lru_cache
+from string import Template
+
 from backend.literesearch.research_enums import ReportSource, Tone
 
 
+@lru_cache(maxsize=2)
+def _date_strings(day_key: int):
+    """
+    Build the date strings interpolated into prompts, cached per UTC day
+
+    :param day_key: Current day number (time // 86400), used as cache key
+    :return: Tuple of (ISO local date, long-form UTC date)
+    """
+    return str(date.today()), datetime.now(timezone.utc).strftime("%B %d, %Y")
+
+
+def _today() -> str:
+    """Get the current local date as an ISO string (cached per day)"""
+    return _date_strings(int(time.time() // 86400))[0]
+
+
+def _utc_date() -> str:
+    """Get the current UTC date in long form (cached per day)"""
+    return _date_strings(int(time.time() // 86400))[1]
+
+
+@lru_cache(maxsize=None)
 def auto_agent_instructions():
     return """
     This task involves researching a given topic, regardless of its complexity or whether there are clear answers. Research is performed by specific agents, and each agent requires different instructions based on their type and role definition.
@@ -48,50 +74,66 @@ def generate_search_queries_prompt(
     )
 
 
-def generate_report_prompt(
-    question: str,
-    context,
-    report_source: str,
-    report_format="apa",
-    total_words=1000,
-    tone=None,
-):
-    reference_prompt = ""
-    if report_source == ReportSource.Web.value:
-        reference_prompt = f"""
+# Static prompt skeletons are precompiled once at import; the builder
+# functions below only interpolate the dynamic fields
+_WEB_REFERENCE_PROMPT = """
             You must list all used source URLs as references at the end of the report, ensuring no duplicate sources are added, with each source listed only once.
             Each URL should be in hyperlink format: [Website Name](URL)
             Additionally, you must include hyperlinks when citing relevant URLs in the report:
 
             Example: Author, A. A. (Year, Month Day). Web Page Title. Website Name. [Website Name](URL)
             """
-    else:
-        reference_prompt = f"""
+
+_DOCUMENT_REFERENCE_PROMPT = """
             You must list all used source document names as references at the end of the report, ensuring no duplicate sources are added, with each source listed only once.
         """
 
-    tone_prompt = f"Please write the report in a {tone.value} tone." if tone else ""
-
-    return f"""
-Information: "{context}"
+_REPORT_PROMPT_TEMPLATE = Template("""
+Information: "$context"
 ---
-Using the above information, answer the following query or task in the form of a detailed report: "{question}" --
-The report should focus on answering the query, be well-structured, informative, in-depth and comprehensive, including facts and data (if available), with at least {total_words} words.
+Using the above information, answer the following query or task in the form of a detailed report: "$question" --
+The report should focus on answering the query, be well-structured, informative, in-depth and comprehensive, including facts and data (if available), with at least $total_words words.
 You should use all relevant and necessary information as thoroughly as possible to write the report.
 
 Please follow all the following guidelines in your report:
 - You must form your own specific and valid viewpoints based on the given information. Do not draw generic and meaningless conclusions.
-- You must write the report using markdown syntax and {report_format} format.
+- You must write the report using markdown syntax and $report_format format.
 - Use an objective and impartial journalistic tone.
-- Use {report_format} format in-text citations and place them as markdown hyperlinks at the end of sentences or paragraphs that cite them, such as: ([In-text citation](url)).
-- Don't forget to add a reference list in {report_format} format at the end of the report, including complete URL links (without hyperlinks).
-- {reference_prompt}
-- {tone_prompt}
+- Use $report_format format in-text citations and place them as markdown hyperlinks at the end of sentences or paragraphs that cite them, such as: ([In-text citation](url)).
+- Don't forget to add a reference list in $report_format format at the end of the report, including complete URL links (without hyperlinks).
+- $reference_prompt
+- $tone_prompt
 - You must write the entire report in English.
 
 Please do your best, this is very important for my career.
-Assume the current date is {date.today()}.
-"""
+Assume the current date is $today.
+""")
+
+
+def generate_report_prompt(
+    question: str,
+    context,
+    report_source: str,
+    report_format="apa",
+    total_words=1000,
+    tone=None,
+):
+    if report_source == ReportSource.Web.value:
+        reference_prompt = _WEB_REFERENCE_PROMPT
+    else:
+        reference_prompt = _DOCUMENT_REFERENCE_PROMPT
+
+    tone_prompt = f"Please write the report in a {tone} tone." if tone else ""
+
+    return _REPORT_PROMPT_TEMPLATE.substitute(
+        context=context,
+        question=question,
+        total_words=total_words,
+        report_format=report_format,
+        reference_prompt=reference_prompt,
+        tone_prompt=tone_prompt,
+        today=_today(),
+    )
 
 
 def generate_resource_report_prompt(
@@ -129,27 +171,17 @@ You must write the entire outline in English.
     """
 
 
-def generate_subtopic_report_prompt(
-    current_subtopic,
-    existing_headers: list,
-    main_topic: str,
-    context,
-    report_format: str = "apa",
-    max_subsections=5,
-    total_words=800,
-    tone: Tone = Tone.Objective,
-) -> str:
-    return f"""
+_SUBTOPIC_REPORT_PROMPT_TEMPLATE = Template("""
 "Background Information":
-"{context}"
+"$context"
 
 "Topic and Subtopic":
-Using the latest available information, write a detailed report on the subtopic "{current_subtopic}" under the main topic "{main_topic}".
-The number of subsections should not exceed {max_subsections}.
+Using the latest available information, write a detailed report on the subtopic "$current_subtopic" under the main topic "$main_topic".
+The number of subsections should not exceed $max_subsections.
 
 "Content Focus":
 - The report should focus on answering the question, be well-structured, informative, in-depth and comprehensive, including facts and data (if available).
-- Use markdown syntax, following {report_format.upper()} format.
+- Use markdown syntax, following $report_format format.
 
 "Structure and Format":
 - Since this subtopic report will be part of a larger report, only include the main content divided into appropriate subtopics, without introduction or conclusion sections.
@@ -161,47 +193,82 @@ The number of subsections should not exceed {max_subsections}.
 "Existing Subtopic Reports":
 - The following is a list of existing subtopic reports and their section titles:
 
-    {existing_headers}.
+    $existing_headers.
 
 - Do not use any of the above titles or related details to avoid duplication. Use smaller Markdown headings (such as H2 or H3) to organize content structure, avoiding the largest heading (H1) as it will be used for the larger report title.
 
 "Date":
-If needed, assume the current date is {datetime.now(timezone.utc).strftime('%B %d, %Y')}.
+If needed, assume the current date is $date.
 
 "Important Notes!":
 - Must focus on the topic! Must omit any information unrelated to it!
 - Must not include any introduction, conclusion, summary, or reference sections.
 - You must use markdown hyperlinks ([Website Name](URL)) where necessary.
-- The report should be at least {total_words} words.
-- Use a {tone.value} tone throughout the report.
+- The report should be at least $total_words words.
+- Use a $tone tone throughout the report.
 - You must write the entire report in English.
-"""
+""")
 
 
-def generate_report_introduction_prompt(
-    question: str, research_summary: str = ""
+def generate_subtopic_report_prompt(
+    current_subtopic,
+    existing_headers: list,
+    main_topic: str,
+    context,
+    report_format: str = "apa",
+    max_subsections=5,
+    total_words=800,
+    tone: Tone = Tone.Objective,
 ) -> str:
-    return f"""{research_summary}\n
-    Using the above latest information, prepare a detailed report introduction for the topic -- {question}.
+    return _SUBTOPIC_REPORT_PROMPT_TEMPLATE.substitute(
+        context=context,
+        current_subtopic=current_subtopic,
+        main_topic=main_topic,
+        max_subsections=max_subsections,
+        report_format=report_format.upper(),
+        existing_headers=existing_headers,
+        date=_utc_date(),
+        total_words=total_words,
+        tone=tone,
+    )
+
+
+_REPORT_INTRODUCTION_PROMPT_TEMPLATE = Template("""$research_summary\n
+    Using the above latest information, prepare a detailed report introduction for the topic -- $question.
     - The introduction should be concise, well-structured, informative, and use markdown syntax.
     - Since this introduction will be part of a larger report, do not include any other sections that would normally exist in a report.
     - The introduction should be preceded by an H1 title suitable for the entire report.
     - You must use markdown hyperlinks ([Website Name](URL)) where necessary.
     - You must write the entire introduction in English.
-    If needed, assume the current date is {datetime.now(timezone.utc).strftime('%B %d, %Y')}.
-"""
+    If needed, assume the current date is $date.
+""")
+
+
+def generate_report_introduction_prompt(
+    question: str, research_summary: str = ""
+) -> str:
+    return _REPORT_INTRODUCTION_PROMPT_TEMPLATE.substitute(
+        research_summary=research_summary,
+        question=question,
+        date=_utc_date(),
+    )
+
+
+# Built once at import; get_report_by_type is called for every report and
+# subtopic, and rebuilding the mapping per call adds nothing
+_REPORT_TYPE_MAPPING = {
+    "research_report": generate_report_prompt,
+    "resource_report": generate_resource_report_prompt,
+    "outline_report": generate_outline_report_prompt,
+    "subtopic_report": generate_subtopic_report_prompt,
+}
 
 
 def get_report_by_type(report_type: str):
-    report_type_mapping = {
-        "research_report": generate_report_prompt,
-        "resource_report": generate_resource_report_prompt,
-        "outline_report": generate_outline_report_prompt,
-        "subtopic_report": generate_subtopic_report_prompt,
-    }
-    return report_type_mapping.get(report_type, generate_report_prompt)
+    return _REPORT_TYPE_MAPPING.get(report_type, generate_report_prompt)
 
 
+@lru_cache(maxsize=None)
 def generate_subtopics_prompt() -> str:
     return """
     Based on the following topic:
@@ -1,11 +1,34 @@
 # backend/literesearch/web_retriever.py
 
+import asyncio
+import atexit
+import hashlib
 import os
-from typing import List, Dict, Any
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import List, Dict, Any, Optional, Tuple
+import httpx
+import numpy as np
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from concurrent.futures import ThreadPoolExecutor
-from functools import partial
+from functools import lru_cache, partial
+from itertools import islice
+from urllib.parse import urlsplit, urlunsplit
+
+from requests.adapters import HTTPAdapter, Retry
+
+from backend.literesearch.constants import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_SIMILARITY_THRESHOLD,
+    MAX_SCRAPE_BYTES,
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_TTL,
+)
 
 from tavily import TavilyClient
 from duckduckgo_search import DDGS
@@ -20,6 +43,26 @@ from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 
 
+# Process-wide scrape session: one connection pool sized for the scraper
+# thread pool, so keep-alive connections and TLS sessions are reused across
+# research runs instead of re-handshaking per Scraper instance
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=64,
+    pool_maxsize=DEFAULT_MAX_WORKERS,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
+# Persistent scrape thread pool: reused across research runs so threads are
+# created once per process instead of per Scraper.run call
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="scrape"
+)
+atexit.register(_EXECUTOR.shutdown)
+
+
 class TavilyAPIError(Exception):
     """Tavily API related error"""
     pass
@@ -30,6 +73,61 @@ class ScrapingError(Exception):
     pass
 
 
+# In-process TTL cache for search results: identical sub-queries recur
+# across research iterations, and a hit skips a multi-hundred-ms API call
+_search_cache: Dict[Tuple[str, str, int], Tuple[float, List[Dict[str, str]]]] = {}
+_search_cache_lock = threading.Lock()
+
+
+def _search_cache_get(key: Tuple[str, str, int]) -> Optional[List[Dict[str, str]]]:
+    """
+    Get fresh cached search results, evicting the entry if expired
+
+    :param key: Cache key (query, topic, max_results)
+    :return: Cached results, or None on miss
+    """
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry is None:
+            return None
+        fetched_at, results = entry
+        if time.time() - fetched_at >= SEARCH_CACHE_TTL:
+            del _search_cache[key]
+            return None
+        return results
+
+
+def _search_cache_set(key: Tuple[str, str, int], results: List[Dict[str, str]]) -> None:
+    """
+    Store search results, evicting the oldest entry when full
+
+    :param key: Cache key (query, topic, max_results)
+    :param results: Search results to cache
+    """
+    with _search_cache_lock:
+        if len(_search_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+            oldest = min(_search_cache, key=lambda k: _search_cache[k][0])
+            del _search_cache[oldest]
+        _search_cache[key] = (time.time(), results)
+
+
+@lru_cache(maxsize=4)
+def _tavily_client(api_key: str) -> TavilyClient:
+    """
+    Get a shared TavilyClient for an API key
+
+    :param api_key: Tavily API key
+    :return: Shared client instance
+    """
+    return TavilyClient(api_key=api_key)
+
+
+@lru_cache(maxsize=1)
+def _ddgs() -> DDGS:
+    """Get the shared DuckDuckGo search client"""
+    return DDGS()
+
+
 class TavilySearch:
     """Tavily Search API"""
 
@@ -38,7 +136,9 @@ class TavilySearch:
     ):
         self.query = query
         self.headers = headers or {}
-        self.client = TavilyClient(api_key=self._get_api_key())
+        # Clients are shared per API key so the underlying HTTP session
+        # (and its TLS connection) survives across searches
+        self.client = _tavily_client(self._get_api_key())
         self.topic = topic
 
     def _get_api_key(self) -> str:
@@ -60,6 +160,11 @@ class TavilySearch:
         :param max_results: Maximum number of results
         :return: List of search results
         """
+        cache_key = (self.query, self.topic, max_results)
+        cached = _search_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             results = self.client.search(
                 self.query,
@@ -70,18 +175,23 @@ class TavilySearch:
             sources = results.get("results", [])
             if not sources:
                 raise TavilyAPIError("Tavily API search found no results.")
-            return [{"href": obj["url"], "body": obj["content"]} for obj in sources]
+            formatted = [
+                {"href": obj["url"], "body": obj["content"]} for obj in sources
+            ]
+            _search_cache_set(cache_key, formatted)
+            return formatted
         except TavilyAPIError:
             raise  # Re-raise Tavily-specific errors
         except Exception as e:
             print(f"Tavily search error: {e}. Falling back to DuckDuckGo search API...")
             try:
-                ddg = DDGS()
                 results = list(
-                    ddg.text(self.query, region="wt-wt", max_results=max_results)
+                    _ddgs().text(self.query, region="wt-wt", max_results=max_results)
                 )
                 if not results:
                     print("DuckDuckGo search also found no results.")
+                else:
+                    _search_cache_set(cache_key, results)
                 return results
             except Exception as ddg_error:
                 print(f"DuckDuckGo search error: {ddg_error}. Failed to retrieve sources. Returning empty response.")
@@ -107,6 +217,161 @@ def get_default_retriever():
     return TavilySearch
 
 
+class ScrapedContentCache:
+    """Persistent cache of scraped page text keyed by URL
+
+    The same URLs recur across sub-queries and research sessions; caching
+    extracted text (zlib-compressed, in SQLite next to the LLM cache) turns
+    repeat scrapes into near-zero-latency local reads. Stored ETag /
+    Last-Modified validators allow cheap conditional revalidation once the
+    TTL expires.
+    """
+
+    def __init__(self, database_path: str):
+        """
+        Initialize scraped content cache
+
+        :param database_path: Path to the SQLite database file
+        """
+        os.makedirs(os.path.dirname(database_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(database_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS scraped_pages ("
+            "url TEXT PRIMARY KEY, content BLOB, etag TEXT, "
+            "last_modified TEXT, fetched_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached entry for a URL
+
+        :param url: Page URL
+        :return: Dict with text/etag/last_modified/fetched_at, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, etag, last_modified, fetched_at "
+                "FROM scraped_pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "text": zlib.decompress(row[0]).decode(),
+            "etag": row[1],
+            "last_modified": row[2],
+            "fetched_at": row[3],
+        }
+
+    def set(
+        self,
+        url: str,
+        text: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """
+        Store or refresh a cached entry
+
+        :param url: Page URL
+        :param text: Extracted page text
+        :param etag: ETag response header (optional)
+        :param last_modified: Last-Modified response header (optional)
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scraped_pages VALUES (?, ?, ?, ?, ?)",
+                (url, zlib.compress(text.encode(), 3), etag, last_modified, time.time()),
+            )
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """
+        Refresh the fetch timestamp after a successful revalidation
+
+        :param url: Page URL
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE scraped_pages SET fetched_at = ? WHERE url = ?",
+                (time.time(), url),
+            )
+            self._conn.commit()
+
+
+_SCRAPE_CACHE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "data", "scrape_cache", "pages.db"
+)
+_scrape_cache: Optional[ScrapedContentCache] = None
+_scrape_cache_lock = threading.Lock()
+
+
+def get_scrape_cache() -> ScrapedContentCache:
+    """
+    Get the process-wide scraped content cache
+
+    :return: Shared ScrapedContentCache instance
+    """
+    global _scrape_cache
+    if _scrape_cache is None:
+        with _scrape_cache_lock:
+            if _scrape_cache is None:
+                _scrape_cache = ScrapedContentCache(_SCRAPE_CACHE_PATH)
+    return _scrape_cache
+
+
+def _header_charset(content_type: str) -> Optional[str]:
+    """
+    Extract an explicitly declared charset from a Content-Type header
+
+    When the server declares one, it is passed straight to lxml; otherwise
+    lxml's own C-level detection reads it from the document, avoiding the
+    HTTP clients' Python-side encoding guessing either way.
+
+    :param content_type: Content-Type header value (lowercased)
+    :return: Declared charset, or None
+    """
+    if "charset=" not in content_type:
+        return None
+    charset = content_type.split("charset=")[-1].split(";")[0]
+    return charset.strip().strip("\"'") or None
+
+
+_CONTENT_XPATH = "//p|//h1|//h2|//h3|//h4|//h5"
+_WHITESPACE_RE = re.compile(r"\s{2,}")
+
+
+def _extract_text(content: bytes, encoding: Optional[str]) -> str:
+    """
+    Extract readable text from an HTML response body
+
+    Parses with lxml directly (no BeautifulSoup tree on top) and selects
+    the content tags with one XPath pass; whitespace is collapsed with a
+    single compiled regex instead of nested generator passes.
+
+    :param content: Raw response body
+    :param encoding: Response encoding, if known
+    :return: Cleaned text content
+    """
+    parser = None
+    if encoding:
+        try:
+            parser = lxml_html.HTMLParser(encoding=encoding)
+        except LookupError:
+            # Malformed charset declarations (e.g. "utf-8,utf-8") are
+            # common in the wild; fall back to lxml's own detection
+            parser = None
+    tree = lxml_html.fromstring(content, parser=parser)
+    etree.strip_elements(tree, "script", "style", with_tail=False)
+
+    raw_content = "\n".join(
+        element.text_content() for element in tree.xpath(_CONTENT_XPATH)
+    )
+    return _WHITESPACE_RE.sub("\n", raw_content).strip()
+
+
 class BeautifulSoupScraper:
     """Web scraper using BeautifulSoup"""
 
@@ -121,6 +386,12 @@ class BeautifulSoupScraper:
         self.link = link
         self.session = session or requests.Session()
         self.config = config
+        # Conditional request validators (set by callers holding a cached
+        # copy) and response metadata captured for the cache
+        self.conditional_headers: Dict[str, str] = {}
+        self.response_etag: Optional[str] = None
+        self.response_last_modified: Optional[str] = None
+        self.not_modified = False
 
     def scrape(self) -> str:
         """
@@ -131,24 +402,33 @@ class BeautifulSoupScraper:
         """
         try:
             timeout = self.config.DEFAULT_TIMEOUT if self.config else 4
-            response = self.session.get(self.link, timeout=timeout)
-            response.raise_for_status()  # Check for HTTP errors
-            # Skip PDF or non-HTML resources if encountered
-            content_type = response.headers.get("Content-Type", "").lower()
-            if "application/pdf" in content_type:
-                return ""
-            
-            soup = BeautifulSoup(
-                response.content, "lxml", from_encoding=response.encoding
-            )
-
-            for script_or_style in soup(["script", "style"]):
-                script_or_style.extract()
-
-            raw_content = self._get_content_from_url(soup)
-            lines = (line.strip() for line in raw_content.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            return "\n".join(chunk for chunk in chunks if chunk)
+            with self.session.get(
+                self.link,
+                timeout=timeout,
+                headers=self.conditional_headers or None,
+                stream=True,
+            ) as response:
+                if response.status_code == 304:
+                    # Server confirms the cached copy is still valid
+                    self.not_modified = True
+                    return ""
+                response.raise_for_status()  # Check for HTTP errors
+                self.response_etag = response.headers.get("ETag")
+                self.response_last_modified = response.headers.get("Last-Modified")
+                # Skip PDF or non-HTML resources if encountered, before
+                # downloading the body
+                content_type = response.headers.get("Content-Type", "").lower()
+                if "application/pdf" in content_type:
+                    return ""
+                content_length = response.headers.get("Content-Length")
+                if content_length and int(content_length) > MAX_SCRAPE_BYTES:
+                    return ""
+
+                # Read at most MAX_SCRAPE_BYTES so one oversized page cannot
+                # dominate memory or parse time
+                body = response.raw.read(MAX_SCRAPE_BYTES, decode_content=True)
+
+            return _extract_text(body, _header_charset(content_type))
 
         except requests.exceptions.RequestException as e:
             print(f"Network request error {self.link}: {str(e)}")
@@ -157,25 +437,17 @@ class BeautifulSoupScraper:
             print(f"Error scraping {self.link}: {str(e)}")
             return ""
 
-    def _get_content_from_url(self, soup: BeautifulSoup) -> str:
-        """
-        Extract content from BeautifulSoup object
-
-        :param soup: BeautifulSoup object
-        :return: Extracted text content
-        """
-        text = ""
-        tags = ["p", "h1", "h2", "h3", "h4", "h5"]
-        for element in soup.find_all(tags):
-            text += element.text + "\n"
-        return text
-
 
 class Scraper:
     """Web scraper"""
 
     def __init__(
-        self, urls: List[str], user_agent: str, config=None, scraper_class=BeautifulSoupScraper
+        self,
+        urls: List[str],
+        user_agent: str,
+        config=None,
+        scraper_class=BeautifulSoupScraper,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize scraper
@@ -184,10 +456,13 @@ class Scraper:
         :param user_agent: User agent string
         :param config: Configuration object
         :param scraper_class: Scraper class to use
+        :param session: Optional shared session, so pooled connections and
+            TLS sessions are reused across scrape batches
         """
         self.urls = urls
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": user_agent})
+        self.session = session or _SESSION
+        if self.session.headers.get("User-Agent") != user_agent:
+            self.session.headers.update({"User-Agent": user_agent})
         self.scraper_class = scraper_class
         self.config = config
 
@@ -198,10 +473,7 @@ class Scraper:
         :return: List of scraping results
         """
         partial_extract = partial(self._extract_data_from_link, session=self.session)
-        max_workers = self.config.DEFAULT_MAX_WORKERS if self.config else 20
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            contents = executor.map(partial_extract, self.urls)
+        contents = _EXECUTOR.map(partial_extract, self.urls)
         return [content for content in contents if content["raw_content"] is not None]
 
     def _extract_data_from_link(
@@ -215,30 +487,221 @@ class Scraper:
         :return: Dictionary containing scraping results
         """
         try:
+            cache = get_scrape_cache()
+            ttl = getattr(self.config, "scrape_cache_ttl", 0) if self.config else 0
+            cached = cache.get(link) if ttl else None
+            if cached and time.time() - cached["fetched_at"] < ttl:
+                return {"url": link, "raw_content": cached["text"]}
+
             scraper = self.scraper_class(link, session, self.config)
+            if cached:
+                # Stale entry: revalidate with conditional headers
+                if cached["etag"]:
+                    scraper.conditional_headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    scraper.conditional_headers["If-Modified-Since"] = cached[
+                        "last_modified"
+                    ]
             content = scraper.scrape()
 
+            if scraper.not_modified and cached:
+                cache.touch(link)
+                return {"url": link, "raw_content": cached["text"]}
+
             min_length = self.config.MIN_CONTENT_LENGTH if self.config else 100
             if len(content) < min_length:
                 return {"url": link, "raw_content": None}
+
+            if ttl:
+                cache.set(
+                    link,
+                    content,
+                    etag=scraper.response_etag,
+                    last_modified=scraper.response_last_modified,
+                )
             return {"url": link, "raw_content": content}
         except Exception as e:
             print(f"Error extracting data from {link}: {str(e)}")
             return {"url": link, "raw_content": None}
 
 
-def scrape_urls(urls: List[str], cfg: Any) -> List[Dict[str, Any]]:
+def _normalize_url(url: str) -> str:
+    """
+    Normalize a URL for deduplication
+
+    Lowercases the scheme and host, drops default ports and fragments, so
+    trivially different spellings of the same page compare equal.
+
+    :param url: URL to normalize
+    :return: Normalized URL
+    """
+    parts = urlsplit(url)
+    netloc = parts.netloc.lower()
+    if (parts.scheme == "http" and netloc.endswith(":80")) or (
+        parts.scheme == "https" and netloc.endswith(":443")
+    ):
+        netloc = netloc.rsplit(":", 1)[0]
+    return urlunsplit((parts.scheme.lower(), netloc, parts.path, parts.query, ""))
+
+
+def _dedupe_urls(urls: List[str]) -> List[str]:
+    """
+    Drop URLs that normalize to an already-seen page, preserving order
+
+    :param urls: URLs to deduplicate
+    :return: Deduplicated URLs (original spellings kept)
+    """
+    deduped = []
+    seen = set()
+    for url in urls:
+        key = _normalize_url(url)
+        if key not in seen:
+            seen.add(key)
+            deduped.append(url)
+    return deduped
+
+
+def scrape_urls(
+    urls: List[str], cfg: Any, session: Optional[requests.Session] = None
+) -> List[Dict[str, Any]]:
     """
     Scrape multiple URLs
 
     :param urls: List of URLs to scrape
     :param cfg: Configuration object
+    :param session: Optional shared session reused across scrape batches
     :return: List of scraping results
     """
-    scraper = Scraper(urls, cfg.user_agent, cfg)
+    scraper = Scraper(_dedupe_urls(urls), cfg.user_agent, cfg, session=session)
     return scraper.run()
 
 
+# Async HTTP clients keyed by event loop: HTTP/2 multiplexing folds
+# concurrent requests to the same host onto one connection, and the pool
+# persists across scrape batches on the same loop. Pooled connections bind
+# to the loop that created them, so a client is never reused across
+# asyncio.run() calls, where its keep-alive connections would be dead
+_httpx_clients: Dict[Tuple[int, str], Tuple[Any, httpx.AsyncClient]] = {}
+
+
+def _get_async_client(user_agent: str) -> httpx.AsyncClient:
+    """
+    Get the async HTTP client owned by the running event loop
+
+    :param user_agent: User agent string for outgoing requests
+    :return: httpx.AsyncClient bound to the running loop
+    """
+    loop = asyncio.get_running_loop()
+    for key, (cached_loop, _) in list(_httpx_clients.items()):
+        if cached_loop.is_closed():
+            # The owning loop is gone; its pooled connections are dead
+            del _httpx_clients[key]
+    key = (id(loop), user_agent)
+    entry = _httpx_clients.get(key)
+    if entry is None or entry[1].is_closed:
+        entry = (
+            loop,
+            httpx.AsyncClient(
+                http2=True,
+                headers={"User-Agent": user_agent},
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=40),
+                follow_redirects=True,
+            ),
+        )
+        _httpx_clients[key] = entry
+    return entry[1]
+
+
+async def _async_fetch_page(
+    client: httpx.AsyncClient, link: str, cfg: Any
+) -> Dict[str, Any]:
+    """
+    Fetch and extract a single page asynchronously
+
+    Mirrors Scraper._extract_data_from_link, including the persistent cache
+    and conditional revalidation; HTML parsing runs in a worker thread so it
+    does not block the event loop.
+
+    :param client: Shared async HTTP client
+    :param link: URL to scrape
+    :param cfg: Configuration object
+    :return: Dictionary containing scraping results
+    """
+    try:
+        cache = get_scrape_cache()
+        ttl = getattr(cfg, "scrape_cache_ttl", 0) if cfg else 0
+        cached = cache.get(link) if ttl else None
+        if cached and time.time() - cached["fetched_at"] < ttl:
+            return {"url": link, "raw_content": cached["text"]}
+
+        headers: Dict[str, str] = {}
+        if cached:
+            # Stale entry: revalidate with conditional headers
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        timeout = cfg.DEFAULT_TIMEOUT if cfg else 4
+        async with client.stream(
+            "GET", link, timeout=timeout, headers=headers or None
+        ) as response:
+            if response.status_code == 304 and cached:
+                cache.touch(link)
+                return {"url": link, "raw_content": cached["text"]}
+            response.raise_for_status()
+
+            content_type = response.headers.get("Content-Type", "").lower()
+            if "application/pdf" in content_type:
+                return {"url": link, "raw_content": None}
+            content_length = response.headers.get("Content-Length")
+            if content_length and int(content_length) > MAX_SCRAPE_BYTES:
+                return {"url": link, "raw_content": None}
+
+            # Accumulate at most MAX_SCRAPE_BYTES of body
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body.extend(chunk)
+                if len(body) >= MAX_SCRAPE_BYTES:
+                    del body[MAX_SCRAPE_BYTES:]
+                    break
+
+        content = await asyncio.to_thread(
+            _extract_text, bytes(body), _header_charset(content_type)
+        )
+
+        min_length = cfg.MIN_CONTENT_LENGTH if cfg else 100
+        if len(content) < min_length:
+            return {"url": link, "raw_content": None}
+
+        if ttl:
+            cache.set(
+                link,
+                content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return {"url": link, "raw_content": content}
+    except Exception as e:
+        print(f"Error extracting data from {link}: {str(e)}")
+        return {"url": link, "raw_content": None}
+
+
+async def async_scrape_urls(urls: List[str], cfg: Any) -> List[Dict[str, Any]]:
+    """
+    Scrape multiple URLs concurrently on the event loop
+
+    :param urls: List of URLs to scrape
+    :param cfg: Configuration object
+    :return: List of scraping results
+    """
+    client = _get_async_client(cfg.user_agent)
+    results = await asyncio.gather(
+        *[_async_fetch_page(client, url, cfg) for url in _dedupe_urls(urls)]
+    )
+    return [result for result in results if result["raw_content"] is not None]
+
+
 class SearchAPIRetriever(BaseRetriever):
     """Search API retriever"""
 
@@ -251,21 +714,35 @@ class SearchAPIRetriever(BaseRetriever):
         :param query: Query string
         :return: List of relevant documents
         """
+        # Skip empty pages before allocating Documents; downstream filters
+        # would reject them anyway after paying for the object and metadata
         return [
             Document(
-                page_content=page.get("raw_content", ""),
+                page_content=page["raw_content"],
                 metadata={
                     "title": page.get("title", ""),
                     "source": page.get("url", ""),
                 },
             )
             for page in self.pages
+            if page.get("raw_content")
         ]
 
 
+# Resolved once at import: the env override cannot change mid-process, so
+# per-instance getenv + float parsing is wasted work
+_SIMILARITY_THRESHOLD = float(
+    os.environ.get("SIMILARITY_THRESHOLD", DEFAULT_SIMILARITY_THRESHOLD)
+)
+
+
 class ContextCompressor:
     """Context compressor"""
 
+    # Shared across instances: the splitter is stateless and its separator
+    # setup need not be repeated per sub-query
+    _SPLITTER = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=100)
+
     def __init__(
         self,
         documents: List[Dict[str, Any]],
@@ -282,10 +759,34 @@ class ContextCompressor:
         :param kwargs: Other parameters
         """
         self.max_results = max_results
-        self.documents = documents
+        self.documents = self._deduplicate_documents(documents)
         self.kwargs = kwargs
         self.embeddings = embeddings
-        self.similarity_threshold = float(os.environ.get("SIMILARITY_THRESHOLD", 0.38))
+        self.similarity_threshold = _SIMILARITY_THRESHOLD
+
+    @staticmethod
+    def _deduplicate_documents(
+        documents: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Drop documents whose scraped text duplicates an earlier one
+
+        Overlapping pages (e.g. republished news wires) would otherwise be
+        split and embedded multiple times per research round.
+
+        :param documents: List of documents
+        :return: Documents with unique raw content, in original order
+        """
+        seen: set = set()
+        unique_documents = []
+        for document in documents:
+            content = document.get("raw_content") or ""
+            digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+            if digest in seen:
+                continue
+            seen.add(digest)
+            unique_documents.append(document)
+        return unique_documents
 
     def get_contextual_retriever(self) -> ContextualCompressionRetriever:
         """
@@ -293,12 +794,11 @@ class ContextCompressor:
 
         :return: Contextual compression retriever
         """
-        splitter = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=100)
         relevance_filter = EmbeddingsFilter(
             embeddings=self.embeddings, similarity_threshold=self.similarity_threshold
         )
         pipeline_compressor = DocumentCompressorPipeline(
-            transformers=[splitter, relevance_filter]
+            transformers=[self._SPLITTER, relevance_filter]
         )
         base_retriever = SearchAPIRetriever()
         base_retriever.pages = self.documents
@@ -318,18 +818,69 @@ class ContextCompressor:
             f"Source: {d.metadata.get('source')}\n"
             f"Title: {d.metadata.get('title')}\n"
             f"Content: {d.page_content}\n"
-            for i, d in enumerate(docs)
-            if i < top_n
+            for d in islice(docs, top_n)
         )
 
+    def _split_documents(self) -> List[Tuple[str, str, str]]:
+        """
+        Split documents into chunks, keeping source metadata per chunk
+
+        :return: List of (chunk, source, title) tuples
+        """
+        chunks = []
+        for page in self.documents:
+            raw_content = page.get("raw_content") or ""
+            for chunk in self._SPLITTER.split_text(raw_content):
+                chunks.append((chunk, page.get("url", ""), page.get("title", "")))
+        return chunks
+
     async def get_context(self, query: str, max_results: int = 5) -> str:
         """
         Get context for query
 
+        All chunks are embedded in one batched embed_documents call and
+        scored against the query with a single vectorized cosine pass,
+        instead of flowing chunk-by-chunk through a compressor pipeline.
+
         :param query: Query string
         :param max_results: Maximum number of results
         :return: Compressed context string
         """
-        compressed_docs = self.get_contextual_retriever()
-        relevant_docs = compressed_docs.invoke(query)
+        chunks = self._split_documents()
+        if not chunks:
+            return ""
+
+        # float32 halves the footprint of the default float64 matrix while
+        # keeping the similarity pass a single BLAS matrix-vector product
+        chunk_matrix = np.asarray(
+            self.embeddings.embed_documents([chunk for chunk, _, _ in chunks]),
+            dtype=np.float32,
+        )
+        query_vector = np.asarray(
+            self.embeddings.embed_query(query), dtype=np.float32
+        )
+
+        chunk_norms = np.linalg.norm(chunk_matrix, axis=1, keepdims=True)
+        chunk_norms[chunk_norms == 0] = 1.0
+        chunk_matrix /= chunk_norms
+        query_norm = np.linalg.norm(query_vector)
+        if query_norm > 0:
+            query_vector /= query_norm
+        similarities = chunk_matrix @ query_vector
+
+        # Partial-select the top-k in O(n), then sort only those k by score;
+        # a full argsort over hundreds of chunks is wasted work for k ~ 5
+        if len(similarities) > max_results:
+            top_k = np.argpartition(-similarities, max_results)[:max_results]
+        else:
+            top_k = np.arange(len(similarities))
+        ranked = top_k[np.argsort(-similarities[top_k])]
+        relevant_docs = [
+            Document(
+                page_content=chunks[i][0],
+                metadata={"source": chunks[i][1], "title": chunks[i][2]},
+            )
+            for i in ranked
+            if similarities[i] >= self.similarity_threshold
+        ]
         return self.pretty_print_docs(relevant_docs, max_results)
@@ -5,6 +5,15 @@ import asyncio
 import sys
 import os
 
+# Prefer uvloop for the event loop when available; the research pipeline is
+# asyncio fan-out over sockets and benefits from its faster event loop
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Add project root directory to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if project_root not in sys.path:
@@ -30,10 +39,22 @@ from backend.literesearch.constants import (
 from langchain_core.globals import set_llm_cache
 from langchain_community.cache import SQLiteCache
 
-# Set up cache directory
-cache_dir = os.path.join(os.path.dirname(__file__), "..", "data", "llm_cache")
-os.makedirs(cache_dir, exist_ok=True)
-set_llm_cache(SQLiteCache(database_path=os.path.join(cache_dir, "langchain.db")))
+
+@st.cache_resource
+def _init_llm_cache() -> SQLiteCache:
+    """Set up the SQLite LLM cache once per process
+
+    Streamlit re-executes this module on every rerun; cache_resource keeps
+    the directory setup and SQLite handle from repeating per interaction.
+    """
+    cache_dir = os.path.join(os.path.dirname(__file__), "..", "data", "llm_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    cache = SQLiteCache(database_path=os.path.join(cache_dir, "langchain.db"))
+    set_llm_cache(cache)
+    return cache
+
+
+_init_llm_cache()
 
 from frontend.ui_components import (
     apply_styles, 
@@ -4,6 +4,7 @@ Contains style definitions and static UI components
 """
 
 import streamlit as st
+from functools import lru_cache
 
 # Version number
 VERSION = "1.0.0"
@@ -229,6 +230,7 @@ def display_footer():
     )
 
 
+@lru_cache(maxsize=1)
 def get_report_type_display_map():
     """Get report type display mapping"""
     return {
@@ -1,11 +1,29 @@
 import os
-from dotenv import load_dotenv
+import pickle
+import threading
+from dotenv import dotenv_values
+
+# One-shot guard: Streamlit reruns call load_env repeatedly, but secrets and
+# .env only need to be read into os.environ once per process
+_loaded = False
+_load_lock = threading.Lock()
 
 def load_env():
     """
     Load environment variables from .env file or Streamlit secrets
     Compatible with both local development and Streamlit Cloud deployment
     """
+    global _loaded
+    if _loaded:
+        return
+    with _load_lock:
+        if _loaded:
+            return
+        _load_env()
+        _loaded = True
+
+def _load_env():
+    """Perform the actual environment loading"""
     try:
         # Try to import streamlit for cloud deployment
         import streamlit as st
@@ -13,9 +31,9 @@ def load_env():
         # If running on Streamlit Cloud, use st.secrets
         if hasattr(st, 'secrets') and st.secrets:
             # Copy Streamlit secrets to os.environ for compatibility
-            for key, value in st.secrets.items():
-                if isinstance(value, str):
-                    os.environ[key] = value
+            os.environ.update(
+                {k: v for k, v in st.secrets.items() if isinstance(v, str)}
+            )
             print("✅ Environment variables loaded from Streamlit secrets")
             return
     except (ImportError, AttributeError):
@@ -27,10 +45,31 @@ def load_env():
         dotenv_path = os.path.join(project_root, '.env')
         
         if os.path.exists(dotenv_path):
-            load_dotenv(dotenv_path)
+            _load_dotenv_compiled(dotenv_path)
             print("✅ Environment variables loaded from .env file")
         else:
             print("⚠️  No .env file found, using system environment variables")
     except Exception as e:
         print(f"❌ Error loading environment variables: {e}")
-        print("⚠️  Using system environment variables as fallback")
\ No newline at end of file
+        print("⚠️  Using system environment variables as fallback")
+
+def _load_dotenv_compiled(dotenv_path):
+    """
+    Load a .env file through a pickled snapshot when it is up to date
+
+    The line-by-line dotenv parse runs only when .env has changed; cold
+    starts otherwise pay a single pickle.load.
+    """
+    pickle_path = dotenv_path + '.pkl'
+    if (
+        os.path.exists(pickle_path)
+        and os.path.getmtime(pickle_path) >= os.path.getmtime(dotenv_path)
+    ):
+        with open(pickle_path, 'rb') as f:
+            values = pickle.load(f)
+    else:
+        values = {k: v for k, v in dotenv_values(dotenv_path).items() if v is not None}
+        with open(pickle_path, 'wb') as f:
+            pickle.dump(values, f)
+    # Match load_dotenv's default of not overriding existing variables
+    os.environ.update({k: v for k, v in values.items() if k not in os.environ})
\ No newline at end of file
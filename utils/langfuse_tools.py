@@ -4,31 +4,32 @@ Langfuse tools class, providing unified monitoring configuration and management
 
 import os
 import logging
+import threading
 import uuid
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from types import MappingProxyType
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 from langfuse.langchain import CallbackHandler
 
 logger = logging.getLogger(__name__)
 
+# Base metadata attached to every trace; frozen so the no-caller-metadata
+# path can share a single dict instead of allocating one per call
+_BASE_METADATA = MappingProxyType({"application": "LiteResearch"})
+
 
 class LangfuseManager:
     """
     Langfuse monitoring manager for unified management of LLM call monitoring
     """
-    
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(LangfuseManager, cls).__new__(cls)
-        return cls._instance
-    
+
     def __init__(self):
-        if not self._initialized:
-            self._enabled = self._check_langfuse_config()
-            self._initialized = True
-    
+        # Config check deferred to first use so importing this module costs
+        # no env lookups; the lock makes the first check race-free
+        self._enabled: Optional[bool] = None
+        self._enabled_lock = threading.Lock()
+
     def _check_langfuse_config(self) -> bool:
         """
         Check if langfuse configuration is available
@@ -60,18 +61,22 @@ class LangfuseManager:
         Returns:
             CallbackHandler or None: Returns callback handler if langfuse is available, otherwise None
         """
-        if not self._enabled:
+        if not self.is_enabled:
             return None
         
         try:
-            handler = CallbackHandler()
-            if trace_name:
-                handler.trace_name = trace_name
-            if metadata:
-                handler.metadata = metadata
-            if session_id:
-                handler.session_id = session_id
-            return handler
+            # Handlers carry their own HTTP client and batching queues, so
+            # reuse one per (trace, session, metadata) combination
+            try:
+                spec = _HandlerSpec(
+                    trace_name=trace_name,
+                    session_id=session_id,
+                    metadata_items=tuple(sorted(metadata.items())) if metadata else (),
+                )
+                return _build_handler(spec)
+            except TypeError:
+                # Unhashable metadata values; build an uncached handler
+                return _new_handler(trace_name, session_id, metadata)
         except Exception as e:
             logger.error(f"❌ Failed to create Langfuse callback handler: {e}")
             return None
@@ -105,16 +110,89 @@ class LangfuseManager:
     @property
     def is_enabled(self) -> bool:
         """
-        Check if langfuse is enabled
+        Check if langfuse is enabled, resolving the config on first access
         
         Returns:
             bool: Returns True if enabled
         """
+        if self._enabled is None:
+            with self._enabled_lock:
+                if self._enabled is None:
+                    self._enabled = self._check_langfuse_config()
         return self._enabled
 
 
-# Create global instance
-langfuse_manager = LangfuseManager()
+@dataclass(frozen=True, slots=True)
+class _HandlerSpec:
+    """
+    Immutable description of a callback handler configuration
+    
+    Slots keep the per-spec footprint to three references (no __dict__),
+    and frozen hashability makes specs usable as memoization keys.
+    """
+    trace_name: Optional[str]
+    session_id: Optional[str]
+    metadata_items: Tuple[Any, ...] = ()
+
+
+def _new_handler(trace_name: Optional[str],
+                 session_id: Optional[str],
+                 metadata: Optional[Dict[str, Any]]) -> CallbackHandler:
+    """
+    Build a configured CallbackHandler
+    
+    Args:
+        trace_name: Optional trace name
+        session_id: Optional session ID
+        metadata: Optional metadata
+        
+    Returns:
+        CallbackHandler: Configured handler
+    """
+    handler = CallbackHandler()
+    if trace_name:
+        handler.trace_name = trace_name
+    if metadata:
+        handler.metadata = metadata
+    if session_id:
+        handler.session_id = session_id
+    return handler
+
+
+@lru_cache(maxsize=128)
+def _build_handler(spec: _HandlerSpec) -> CallbackHandler:
+    """
+    Build or reuse a CallbackHandler for a handler spec
+    
+    Args:
+        spec: Handler configuration key
+        
+    Returns:
+        CallbackHandler: Shared handler for this spec
+    """
+    return _new_handler(
+        spec.trace_name, spec.session_id, dict(spec.metadata_items) or None
+    )
+
+
+# Lazily created singleton: nothing happens at import time
+_manager: Optional[LangfuseManager] = None
+_manager_lock = threading.Lock()
+
+
+def _get_manager() -> LangfuseManager:
+    """
+    Get the shared LangfuseManager, creating it on first use
+    
+    Returns:
+        LangfuseManager: Shared manager instance
+    """
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = LangfuseManager()
+    return _manager
 
 
 def get_langfuse_config(trace_name: Optional[str] = None,
@@ -133,12 +211,18 @@ def get_langfuse_config(trace_name: Optional[str] = None,
     Returns:
         Dict[str, Any]: Configuration dictionary containing callbacks
     """
+    manager = _get_manager()
+    # Common local-dev case: no Langfuse creds, so skip the metadata merge
+    # and config copy entirely
+    if not manager.is_enabled:
+        return existing_config if existing_config is not None else {}
+
     # Add application identifier to metadata
-    enhanced_metadata = {"application": "LiteResearch"}
-    if metadata:
-        enhanced_metadata.update(metadata)
+    enhanced_metadata = (
+        {**_BASE_METADATA, **metadata} if metadata else _BASE_METADATA
+    )
     
-    return langfuse_manager.get_config_with_callbacks(trace_name, enhanced_metadata, existing_config, session_id)
+    return manager.get_config_with_callbacks(trace_name, enhanced_metadata, existing_config, session_id)
 
 
 def get_langfuse_handler(trace_name: Optional[str] = None,
@@ -155,12 +239,16 @@ def get_langfuse_handler(trace_name: Optional[str] = None,
     Returns:
         CallbackHandler or None: Callback handler
     """
+    manager = _get_manager()
+    if not manager.is_enabled:
+        return None
+
     # Add application identifier to metadata
-    enhanced_metadata = {"application": "LiteResearch"}
-    if metadata:
-        enhanced_metadata.update(metadata)
+    enhanced_metadata = (
+        {**_BASE_METADATA, **metadata} if metadata else _BASE_METADATA
+    )
     
-    return langfuse_manager.get_callback_handler(trace_name, enhanced_metadata, session_id)
+    return manager.get_callback_handler(trace_name, enhanced_metadata, session_id)
 
 
 def generate_session_id() -> str:
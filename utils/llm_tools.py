@@ -1,16 +1,24 @@
+import asyncio
+import hashlib
+import json
 import os
+import sqlite3
+import threading
 import time
 import logging
-import traceback
-from typing import Any, Dict, List, Tuple, Optional, Type, Union
-import requests
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type
 
-import pandas as pd
-from tqdm import tqdm
+import httpx
+import orjson
 from pydantic import BaseModel
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_core.exceptions import OutputParserException
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.output_parsers import BaseOutputParser
+from langchain_core.runnables import RunnableLambda
+
+from utils.rate_limit import get_llm_rate_limiter
 
 # Configure logging
 logging.basicConfig(
@@ -19,6 +27,344 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Shared connection limits for all OpenAI-style endpoints
+_HTTP_LIMITS = dict(max_keepalive_connections=64, max_connections=128)
+
+
+@lru_cache(maxsize=1)
+def _get_http_client() -> httpx.Client:
+    """
+    Get the shared synchronous HTTP/2 client for OpenAI-style endpoints.
+
+    Returns:
+        Shared httpx.Client with pooled, multiplexed connections.
+    """
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(keepalive_expiry=60, **_HTTP_LIMITS),
+    )
+
+
+# Pooled async clients keyed by event loop: connections and pool locks bind
+# to the loop that first uses them, and the app drives each research run
+# through a fresh asyncio.run(), so one process-wide client would carry
+# dead-loop keep-alive connections into every run after the first
+_loop_clients: Dict[int, Tuple[Any, httpx.AsyncClient]] = {}
+_loop_clients_lock = threading.Lock()
+
+
+def _async_client_for_running_loop() -> httpx.AsyncClient:
+    """
+    Get the pooled async client owned by the running event loop.
+
+    Returns:
+        httpx.AsyncClient whose connections belong to the current loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _loop_clients_lock:
+        for key, (cached_loop, _) in list(_loop_clients.items()):
+            if cached_loop.is_closed():
+                # The owning loop is gone, so its pooled connections can
+                # never be used (or gracefully closed) again
+                del _loop_clients[key]
+        entry = _loop_clients.get(id(loop))
+        if entry is None:
+            entry = (
+                loop,
+                httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(keepalive_expiry=60, **_HTTP_LIMITS),
+                ),
+            )
+            _loop_clients[id(loop)] = entry
+        return entry[1]
+
+
+class _LoopLocalAsyncClient(httpx.AsyncClient):
+    """
+    Async client facade that sends through the running loop's pool.
+
+    Model and embedding instances pin their http_async_client at
+    construction and live across research runs, while each run owns a fresh
+    event loop; resolving the pool at send time keeps those long-lived
+    instances safe to reuse on any loop.
+    """
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        return await _async_client_for_running_loop().send(request, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def _get_http_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared asynchronous HTTP/2 client for OpenAI-style endpoints.
+
+    Returns:
+        Loop-local facade; requests use the running loop's connection pool.
+    """
+    return _LoopLocalAsyncClient()
+
+
+_CACHE_MISS = object()
+
+
+class FastJsonOutputParser(BaseOutputParser[Dict[str, Any]]):
+    """
+    JSON output parser backed by orjson and direct Pydantic validation.
+
+    orjson parses several times faster than the stdlib json module, and
+    model_validate on the already-parsed dict skips the generic parser
+    machinery while still enforcing the schema.
+    """
+
+    pydantic_object: Type[BaseModel]
+
+    def parse(self, text: str) -> Dict[str, Any]:
+        """
+        Parse model output into a schema-validated dict.
+
+        Args:
+            text: Raw model output, possibly fenced in a code block.
+
+        Returns:
+            Validated output as a plain dict.
+
+        Raises:
+            OutputParserException: Raised when parsing or validation fails.
+        """
+        stripped = text.strip()
+        if stripped.startswith("```"):
+            first_newline = stripped.find("\n")
+            if first_newline != -1:
+                stripped = stripped[first_newline + 1 :]
+            if stripped.endswith("```"):
+                stripped = stripped[:-3]
+            stripped = stripped.strip()
+        try:
+            parsed = orjson.loads(stripped)
+            return self.pydantic_object.model_validate(parsed).model_dump()
+        except (orjson.JSONDecodeError, ValueError) as e:
+            raise OutputParserException(
+                f"Failed to parse model output as JSON: {e}", llm_output=text
+            ) from e
+
+    @property
+    def _type(self) -> str:
+        return "fast_json_output_parser"
+
+# Rendered once at import; identical for every chain instance
+_FORMAT_INSTRUCTIONS = """
+Output your answer as a JSON object that conforms to the following schema:
+```json
+{schema}
+```
+
+Important instructions:
+1. Ensure your JSON is valid and properly formatted.
+2. Do not include the schema definition in your answer.
+3. Only output the data instance that matches the schema.
+4. Do not include any explanations or comments within the JSON output.
+        """
+
+
+class SchemaCachedModel(BaseModel):
+    """
+    Output-model base class that serializes its JSON schema once.
+
+    Subclasses get SCHEMA_JSON populated at class-definition time, so
+    chain construction reads a prebuilt string instead of walking the
+    field tree per instantiation.
+    """
+
+    SCHEMA_JSON: ClassVar[str] = ""
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.SCHEMA_JSON = json.dumps(cls.model_json_schema(), sort_keys=True)
+
+
+@lru_cache(maxsize=None)
+def _schema_for(model_cls: Type[BaseModel]) -> str:
+    """
+    Get a model's JSON schema, serialized once per class.
+
+    Classes deriving from SchemaCachedModel carry it precomputed; anything
+    else is serialized on first use and memoized.
+
+    Args:
+        model_cls: Pydantic model class.
+
+    Returns:
+        Stable JSON string of the class schema.
+    """
+    precomputed = getattr(model_cls, "SCHEMA_JSON", "")
+    if precomputed:
+        return precomputed
+    return json.dumps(model_cls.model_json_schema(), sort_keys=True)
+
+
+class _ResponseCache:
+    """
+    SQLite-backed cache of parsed chain responses keyed by request hash.
+
+    Sits above the model-level LangChain cache: a hit returns the parsed
+    JSON directly, skipping prompt rendering, the API call, and parsing.
+    """
+
+    def __init__(self, database_path: str):
+        """
+        Initialize response cache.
+
+        Args:
+            database_path: Path to the SQLite database file.
+        """
+        os.makedirs(os.path.dirname(database_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(database_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            "key TEXT PRIMARY KEY, response_json TEXT, created_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Any:
+        """
+        Look up a cached response.
+
+        Args:
+            key: SHA256 request key.
+
+        Returns:
+            The parsed response, or the module miss sentinel.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_json FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return _CACHE_MISS
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a parsed response.
+
+        Args:
+            key: SHA256 request key.
+            value: JSON-serializable parsed response.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), time.time()),
+            )
+            self._conn.commit()
+
+
+@lru_cache(maxsize=1)
+def _get_response_cache() -> _ResponseCache:
+    """
+    Get the shared response cache, creating it on first use.
+
+    Returns:
+        Shared _ResponseCache instance.
+    """
+    path = os.path.join(
+        os.path.dirname(__file__), "..", "data", "llm_cache", "responses.db"
+    )
+    return _ResponseCache(path)
+
+
+def _cache_mode() -> str:
+    """
+    Get the response-cache policy from LLM_CACHE_MODE.
+
+    Supported modes: "enabled" (read and write, default), "readonly"
+    (read without storing), "replay" (read; a miss is an error) and
+    "disabled" (bypass entirely).
+
+    Returns:
+        Cache mode string.
+    """
+    return os.environ.get("LLM_CACHE_MODE", "enabled").lower()
+
+
+@lru_cache(maxsize=1)
+def _llm_env() -> Dict[str, Optional[str]]:
+    """
+    Snapshot the language-model environment variables once.
+
+    Returns:
+        Resolved env values used by init_language_model.
+    """
+    return {
+        "api_key": os.environ.get("OPENAI_API_KEY"),
+        "model": os.getenv("LLM_MODEL", "gpt-4"),
+    }
+
+
+@lru_cache(maxsize=1)
+def _embedding_env() -> Dict[str, Optional[str]]:
+    """
+    Snapshot the embedding environment variables once.
+
+    Returns:
+        Resolved env values used by init_embeddings.
+    """
+    api_key = os.environ.get("EMBEDDING_API_KEY")
+    base_url = os.environ.get("EMBEDDING_API_BASE") or os.environ.get(
+        "EMBEDDING_BASE_URL"
+    )
+    return {
+        "model": os.getenv("EMBEDDING_MODEL", "text-embedding-3-small"),
+        "api_key": api_key or os.environ.get("OPENAI_API_KEY"),
+        "base_url": base_url or os.environ.get("OPENAI_BASE_URL"),
+    }
+
+
+@lru_cache(maxsize=256)
+def _build_prompt(
+    model_cls: Type[BaseModel], sys_msg: str, user_msg: str
+) -> ChatPromptTemplate:
+    """
+    Build (or reuse) the schema-partialed prompt template for a chain.
+
+    Args:
+        model_cls: Pydantic model class defining output structure.
+        sys_msg: System message.
+        user_msg: User message.
+
+    Returns:
+        Fully partialed ChatPromptTemplate.
+    """
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", sys_msg + _FORMAT_INSTRUCTIONS),
+            ("human", user_msg),
+        ]
+    ).partial(schema=_schema_for(model_cls))
+
+    # Provider-side prompt caches key on a stable prefix: once the schema is
+    # bound, the system message must contain no per-call variables, or every
+    # request gets a unique prefix and the cache never hits
+    dynamic_system_vars = set(prompt.messages[0].input_variables) - {"schema"}
+    if dynamic_system_vars:
+        logger.warning(
+            "System message contains per-call variables %s; this defeats "
+            "provider-side prompt caching. Move dynamic values into the "
+            "user message.",
+            sorted(dynamic_system_vars),
+        )
+    return prompt
+
+
+def reset_env_cache() -> None:
+    """Clear the cached env snapshots (after mutating os.environ)."""
+    _llm_env.cache_clear()
+    _embedding_env.cache_clear()
+
+
 def init_language_model(
     temperature: float = 0.0,
     model_name: Optional[str] = None,
@@ -38,10 +384,11 @@ def init_language_model(
     Raises:
         ValueError: Raised when OPENAI_API_KEY environment variable is missing.
     """
-    model_name = model_name or os.getenv("LLM_MODEL", "gpt-4")
-    
+    env = _llm_env()
+    model_name = model_name or env["model"]
+
     # LangChain will automatically read OPENAI_API_KEY and OPENAI_BASE_URL from environment
-    if not os.environ.get("OPENAI_API_KEY"):
+    if not env["api_key"]:
         raise ValueError(
             "OPENAI_API_KEY environment variable is required. Please set it in your environment."
         )
@@ -49,6 +396,8 @@ def init_language_model(
     model_params = {
         "model": model_name,
         "temperature": temperature,
+        "http_client": _get_http_client(),
+        "http_async_client": _get_http_async_client(),
         **kwargs,
     }
 
@@ -89,29 +438,59 @@ class LanguageModelChain:
             raise ValueError("model must be callable")
 
         self.model_cls = model_cls
-        self.parser = JsonOutputParser(pydantic_object=model_cls)
+        self.parser = FastJsonOutputParser(pydantic_object=model_cls)
+
+        schema_json = _schema_for(model_cls)
+
+        # Template construction and schema binding are cached per
+        # (model_cls, sys_msg, user_msg); reruns creating the same chain
+        # reuse the compiled template
+        self.prompt_template = _build_prompt(model_cls, sys_msg, user_msg)
+
+        inner_chain = self.prompt_template | model | self.parser
+
+        # Everything that shapes the response except the per-call inputs
+        llm_key = "||".join(
+            (
+                sys_msg,
+                user_msg,
+                str(getattr(model, "model_name", "")),
+                str(getattr(model, "temperature", "")),
+                schema_json,
+            )
+        )
 
-        format_instructions = """
-Output your answer as a JSON object that conforms to the following schema:
-```json
-{schema}
-```
+        prompt_chars = len(sys_msg) + len(user_msg) + len(schema_json)
 
-Important instructions:
-1. Ensure your JSON is valid and properly formatted.
-2. Do not include the schema definition in your answer.
-3. Only output the data instance that matches the schema.
-4. Do not include any explanations or comments within the JSON output.
-        """
+        def _invoke_with_cache(inputs: Dict[str, Any], config: Any = None) -> Any:
+            mode = _cache_mode()
+            serialized_inputs = json.dumps(inputs, sort_keys=True, default=str)
+
+            if mode != "disabled":
+                key_material = llm_key + "||" + serialized_inputs
+                key = hashlib.sha256(key_material.encode()).hexdigest()
+                cache = _get_response_cache()
 
-        self.prompt_template = ChatPromptTemplate.from_messages(
-            [
-                ("system", sys_msg + format_instructions),
-                ("human", user_msg),
-            ]
-        ).partial(schema=model_cls.model_json_schema())
+                cached = cache.get(key)
+                if cached is not _CACHE_MISS:
+                    return cached
+                if mode == "replay":
+                    raise RuntimeError(
+                        "LLM_CACHE_MODE=replay but no cached response for this request"
+                    )
 
-        self.chain = self.prompt_template | model | self.parser
+            # Rough chars/4 token estimate; only throttles when LLM_RPM or
+            # LLM_TPM is configured
+            get_llm_rate_limiter().acquire(
+                (prompt_chars + len(serialized_inputs)) // 4
+            )
+
+            result = inner_chain.invoke(inputs, config=config)
+            if mode == "enabled":
+                cache.set(key, result)
+            return result
+
+        self.chain = RunnableLambda(_invoke_with_cache)
 
     def __call__(self) -> Any:
         """
@@ -122,6 +501,42 @@ Important instructions:
         """
         return self.chain
 
+    def batch(
+        self, inputs: list, max_concurrency: int = 8, **kwargs: Any
+    ) -> list:
+        """
+        Run the chain over many inputs concurrently.
+
+        Args:
+            inputs: List of chain inputs.
+            max_concurrency: Maximum concurrent invocations.
+            **kwargs: Extra config entries forwarded to the Runnable.
+
+        Returns:
+            Outputs in input order.
+        """
+        return self.chain.batch(
+            inputs, config={"max_concurrency": max_concurrency, **kwargs}
+        )
+
+    async def abatch(
+        self, inputs: list, max_concurrency: int = 8, **kwargs: Any
+    ) -> list:
+        """
+        Async variant of batch.
+
+        Args:
+            inputs: List of chain inputs.
+            max_concurrency: Maximum concurrent invocations.
+            **kwargs: Extra config entries forwarded to the Runnable.
+
+        Returns:
+            Outputs in input order.
+        """
+        return await self.chain.abatch(
+            inputs, config={"max_concurrency": max_concurrency, **kwargs}
+        )
+
 
 def init_embeddings(model_name: Optional[str] = None, **kwargs: Any) -> OpenAIEmbeddings:
     """
@@ -137,15 +552,12 @@ def init_embeddings(model_name: Optional[str] = None, **kwargs: Any) -> OpenAIEm
     Raises:
         ValueError: Raised when OPENAI_API_KEY environment variable is missing.
     """
-    model_name = model_name or os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
-
-    # Prefer dedicated embedding credentials/base when provided
-    embedding_api_key = os.environ.get("EMBEDDING_API_KEY")
-    embedding_api_base = os.environ.get("EMBEDDING_API_BASE") or os.environ.get("EMBEDDING_BASE_URL")
-
-    # If dedicated credentials are not set, fall back to the general OpenAI-style envs
-    api_key = embedding_api_key or os.environ.get("OPENAI_API_KEY")
-    base_url = embedding_api_base or os.environ.get("OPENAI_BASE_URL")
+    # Dedicated embedding credentials take precedence over the general
+    # OpenAI-style envs; the resolution is snapshotted on first call
+    env = _embedding_env()
+    model_name = model_name or env["model"]
+    api_key = env["api_key"]
+    base_url = env["base_url"]
 
     if not api_key:
         raise ValueError(
@@ -156,6 +568,8 @@ def init_embeddings(model_name: Optional[str] = None, **kwargs: Any) -> OpenAIEm
     embedding_params: Dict[str, Any] = {
         "model": model_name,
         "api_key": api_key,
+        "http_client": _get_http_client(),
+        "http_async_client": _get_http_async_client(),
         **kwargs,
     }
     if base_url:
@@ -0,0 +1,98 @@
+"""
+Token-bucket rate limiting for outgoing LLM and embedding requests
+"""
+
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter enforcing requests-per-minute and tokens-per-minute.
+
+    Two buckets refill continuously at rpm/60 and tpm/60 per second;
+    acquire blocks until both hold enough budget, smoothing bursts below
+    provider limits instead of paying 429 back-off latency.
+    """
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rpm: Requests-per-minute budget, or None for unlimited.
+            tpm: Tokens-per-minute budget, or None for unlimited.
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = rpm or 0.0
+        self._tokens = tpm or 0.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, estimated_tokens: int = 0) -> None:
+        """
+        Block until one request and the estimated tokens fit in budget.
+
+        Args:
+            estimated_tokens: Approximate token cost of the upcoming call.
+        """
+        if not self.rpm and not self.tpm:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._last_refill = now
+                if self.rpm:
+                    self._requests = min(
+                        self.rpm, self._requests + elapsed * self.rpm / 60.0
+                    )
+                if self.tpm:
+                    self._tokens = min(
+                        self.tpm, self._tokens + elapsed * self.tpm / 60.0
+                    )
+
+                wait = 0.0
+                if self.rpm and self._requests < 1.0:
+                    wait = max(wait, (1.0 - self._requests) * 60.0 / self.rpm)
+                if self.tpm and estimated_tokens and self._tokens < estimated_tokens:
+                    wait = max(
+                        wait,
+                        (estimated_tokens - self._tokens) * 60.0 / self.tpm,
+                    )
+                if wait == 0.0:
+                    if self.rpm:
+                        self._requests -= 1.0
+                    if self.tpm:
+                        self._tokens -= estimated_tokens
+                    return
+            time.sleep(wait)
+
+
+def _env_float(name: str) -> Optional[float]:
+    """
+    Read an optional float limit from the environment.
+
+    Args:
+        name: Environment variable name.
+
+    Returns:
+        Parsed float, or None when unset or empty.
+    """
+    value = os.environ.get(name)
+    return float(value) if value else None
+
+
+@lru_cache(maxsize=1)
+def get_llm_rate_limiter() -> RateLimiter:
+    """
+    Get the shared limiter for LLM calls, configured via LLM_RPM / LLM_TPM.
+
+    Returns:
+        Shared RateLimiter (unlimited when the env vars are unset).
+    """
+    return RateLimiter(rpm=_env_float("LLM_RPM"), tpm=_env_float("LLM_TPM"))